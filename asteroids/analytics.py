@@ -0,0 +1,293 @@
+"""Query game logs through a cached columnar (.npz) copy.
+
+    python -m asteroids.analytics summary
+    python -m asteroids.analytics events-per-second --events logs/game_events.jsonl
+    python -m asteroids.analytics groups --state logs/game_state.jsonl
+
+The first query on a log streams it in chunks and writes `<log>.npz` next
+to it; later queries load that file unless the log has changed since.
+"""
+
+import argparse
+import json
+import os
+from collections.abc import Iterator
+from typing import Any
+
+import numpy as np
+
+EVENT_LOG_PATH: str = "logs/game_events.jsonl"
+STATE_LOG_PATH: str = "logs/game_state.jsonl"
+
+_CHUNK_BYTES: int = 4 << 20  # Lines parsed per json.loads call
+_CACHE_VERSION: int = 2
+
+# Events that destroy (or split) an asteroid
+KILL_EVENTS: tuple[str, ...] = (
+    "asteroid_shot",
+    "asteroid_destroyed_by_bomb",
+    "player_hit_shield",
+)
+# Older logs wrote the power-up type over the event type
+_LEGACY_POWERUP_TYPES: frozenset[str] = frozenset(
+    ("shield", "speed", "rapid_fire", "triple_shot")
+)
+
+
+def _records(path: str) -> Iterator[list[dict[str, Any]]]:
+    """Yield the log's records in chunks, parsing each chunk in one call"""
+    with open(path) as f:
+        while True:
+            lines = f.readlines(_CHUNK_BYTES)
+            if not lines:
+                return
+            try:
+                yield json.loads("[" + ",".join(lines) + "]")
+            except json.JSONDecodeError:
+                # Most likely a line cut off by a crash, skip just that one
+                chunk = []
+                for line in lines:
+                    try:
+                        chunk.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+                yield chunk
+
+
+def _timestamp(record: dict[str, Any]) -> float | None:
+    # Older logs only have whole seconds since the start, some not even that
+    t = record.get("t", record.get("elapsed_s"))
+    return None if t is None else float(t)
+
+
+def _convert_events(path: str) -> dict[str, np.ndarray]:
+    # Dictionary-encode strings to codes in order of first appearance
+    types: dict[str, int] = {}
+    powerups: dict[str, int] = {"": -1}
+    t: list[np.ndarray] = []
+    frame: list[np.ndarray] = []
+    type_code: list[np.ndarray] = []
+    powerup_code: list[np.ndarray] = []
+    skipped = 0
+    for chunk in _records(path):
+        times = [_timestamp(record) for record in chunk]
+        if None in times:
+            # Without a time they can't be placed in the timeline
+            skipped += times.count(None)
+            chunk = [record for record, at in zip(chunk, times) if at is not None]
+            times = [at for at in times if at is not None]
+        event_types = [record.get("type", "") for record in chunk]
+        chunk_powerups = [record.get("powerup", "") for record in chunk]
+        for i, event_type in enumerate(event_types):
+            if event_type in _LEGACY_POWERUP_TYPES:
+                event_types[i], chunk_powerups[i] = "powerup_collected", event_type
+        t.append(np.array(times, np.float64))
+        frame.append(np.array([record.get("frame", 0) for record in chunk], np.int64))
+        type_code.append(
+            np.array([types.setdefault(e, len(types)) for e in event_types], np.uint16)
+        )
+        powerup_code.append(
+            np.array(
+                [powerups.setdefault(p, len(powerups) - 1) for p in chunk_powerups],
+                np.int16,
+            )
+        )
+    del powerups[""]
+    return {
+        "t": np.concatenate(t) if t else np.zeros(0),
+        "frame": np.concatenate(frame) if frame else np.zeros(0, np.int64),
+        "type": np.concatenate(type_code) if type_code else np.zeros(0, np.uint16),
+        "type_names": np.array(list(types), dtype=str),
+        "powerup": (
+            np.concatenate(powerup_code) if powerup_code else np.zeros(0, np.int16)
+        ),
+        "powerup_names": np.array(list(powerups), dtype=str),
+        "skipped": np.array(skipped),
+    }
+
+
+def _convert_state(path: str) -> dict[str, np.ndarray]:
+    # One snapshot per sampling interval, so rows are few and kept as dicts
+    rows: list[dict[str, float]] = []
+    for chunk in _records(path):
+        for record in chunk:
+            t = _timestamp(record)
+            if t is None:
+                continue
+            row = {"t": t, "frame": record.get("frame", 0)}
+            for key, value in record.items():
+                if isinstance(value, dict) and "count" in value:
+                    row[f"{key}_count"] = value["count"]
+            player = record.get("player")
+            if isinstance(player, dict) and "pos" in player:
+                row["player_x"], row["player_y"] = player["pos"]
+            rows.append(row)
+
+    names = dict.fromkeys(name for row in rows for name in row)
+    # Groups missing from a snapshot had no sprites then
+    return {
+        name: np.array(
+            [row.get(name, np.nan if name.startswith("player_") else 0) for row in rows]
+        )
+        for name in names
+    }
+
+
+def _load(path: str, convert, use_cache: bool = True) -> dict[str, np.ndarray]:
+    stat = os.stat(path)
+    source = np.array([_CACHE_VERSION, stat.st_size, stat.st_mtime_ns], np.int64)
+    cache_path = path + ".npz"
+    if use_cache and os.path.exists(cache_path):
+        with np.load(cache_path) as cached:
+            if np.array_equal(cached["_source"], source):
+                return {
+                    name: cached[name] for name in cached.files if name != "_source"
+                }
+
+    columns = convert(path)
+    if use_cache:
+        np.savez_compressed(cache_path, _source=source, **columns)
+    return columns
+
+
+def load_events(path: str = EVENT_LOG_PATH, use_cache: bool = True) -> dict:
+    """Event log as columns: t, frame, type codes and power-up codes
+
+    `skipped` counts the records left out for having no time at all.
+    """
+    return _load(path, _convert_events, use_cache)
+
+
+def load_state(path: str = STATE_LOG_PATH, use_cache: bool = True) -> dict:
+    """State log as columns: t, frame, `<group>_count` and player position"""
+    return _load(path, _convert_state, use_cache)
+
+
+def events_per_second(events: dict) -> tuple[np.ndarray, np.ndarray]:
+    """Event counts as a (seconds, event types) array, plus the type names"""
+    names = events["type_names"]
+    if len(events["t"]) == 0:
+        return np.zeros((0, len(names)), np.int64), names
+    seconds = events["t"].astype(np.int64)
+    flat = seconds * len(names) + events["type"]
+    counts = np.bincount(flat, minlength=(seconds.max() + 1) * len(names))
+    return counts.reshape(-1, len(names)), names
+
+
+def kill_rate(events: dict) -> dict[str, float]:
+    """Asteroids destroyed in total and per minute of logged play"""
+    names = list(events["type_names"])
+    codes = [names.index(name) for name in KILL_EVENTS if name in names]
+    kills = int(np.isin(events["type"], codes).sum())
+    duration = float(events["t"].max() - events["t"].min()) if kills else 0.0
+    return {
+        "kills": kills,
+        "seconds": duration,
+        "kills_per_minute": kills / duration * 60 if duration > 0 else 0.0,
+    }
+
+
+def powerup_distribution(events: dict) -> dict[str, int]:
+    """How often each power-up type was picked up"""
+    picked = events["powerup"][events["powerup"] >= 0]
+    counts = np.bincount(picked, minlength=len(events["powerup_names"]))
+    return {str(name): int(n) for name, n in zip(events["powerup_names"], counts)}
+
+
+def group_counts(state: dict) -> dict[str, np.ndarray]:
+    """Sprite counts per group over time, keyed by group name"""
+    return {
+        name.removesuffix("_count"): values
+        for name, values in state.items()
+        if name.endswith("_count")
+    }
+
+
+def _print_events_per_second(events: dict) -> None:
+    counts, names = events_per_second(events)
+    print("second " + " ".join(f"{name:>12.12}" for name in names))
+    for second, row in enumerate(counts):
+        if row.any():
+            print(f"{second:>6} " + " ".join(f"{n:>12}" for n in row))
+
+
+def _print_kills(events: dict) -> None:
+    rate = kill_rate(events)
+    print(
+        f"{rate['kills']} asteroids destroyed in {rate['seconds']:.1f}s "
+        f"({rate['kills_per_minute']:.1f}/min)"
+    )
+
+
+def _print_powerups(events: dict) -> None:
+    distribution = powerup_distribution(events)
+    total = sum(distribution.values())
+    for name, count in sorted(distribution.items(), key=lambda item: -item[1]):
+        print(f"{name:<12}{count:>6}{count / total:>8.1%}")
+    if not total:
+        print("no power-ups collected")
+
+
+def _print_groups(state: dict) -> None:
+    groups = group_counts(state)
+    print(f"{'t':>8} " + " ".join(f"{name:>10.10}" for name in groups))
+    for i, t in enumerate(state["t"]):
+        print(f"{t:>8.1f} " + " ".join(f"{int(v[i]):>10}" for v in groups.values()))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "query",
+        choices=("summary", "events-per-second", "kills", "powerups", "groups"),
+        nargs="?",
+        default="summary",
+    )
+    parser.add_argument("--events", default=EVENT_LOG_PATH)
+    parser.add_argument("--state", default=STATE_LOG_PATH)
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="parse the logs without reading or writing the .npz cache",
+    )
+    args = parser.parse_args(argv)
+    try:
+        _run_query(args.query, args.events, args.state, not args.no_cache)
+    except OSError as error:
+        parser.error(f"cannot read log: {error}")
+
+
+def _run_query(query: str, events_path: str, state_path: str, use_cache: bool) -> None:
+    if query == "groups":
+        _print_groups(load_state(state_path, use_cache))
+        return
+
+    events = load_events(events_path, use_cache)
+    if events["skipped"]:
+        print(f"skipped {int(events['skipped'])} events without a time")
+    if query == "events-per-second":
+        _print_events_per_second(events)
+    elif query == "kills":
+        _print_kills(events)
+    elif query == "powerups":
+        _print_powerups(events)
+    else:
+        names, counts = np.unique(events["type"], return_counts=True)
+        print(f"{len(events['t'])} events")
+        for code, count in zip(names, counts):
+            print(f"  {events['type_names'][code]:<28}{count:>8}")
+        _print_kills(events)
+        _print_powerups(events)
+        if os.path.exists(state_path):
+            state = load_state(state_path, use_cache)
+            peaks = {
+                name: int(values.max()) if len(values) else 0
+                for name, values in group_counts(state).items()
+            }
+            print(f"{len(state['t'])} state snapshots, peak counts: {peaks}")
+
+
+if __name__ == "__main__":
+    main()
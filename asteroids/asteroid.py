@@ -1,53 +1,58 @@
-import math
 import random
 
 import pygame
 
 from asteroids.circleshape import CircleShape
-from asteroids.constants import (
-    ASTEROID_MIN_RADIUS,
-    LINE_WIDTH,
-    SCREEN_HEIGHT,
-    SCREEN_WIDTH,
-)
+from asteroids.constants import ASTEROID_MIN_RADIUS
+from asteroids.entities import WRAP_OUTSIDE, ComponentTable, EntityStore
 from asteroids.logger import log_event
+from asteroids.quality import governor
+from asteroids.shapes import asteroid_shapes
 
 
 class Asteroid(CircleShape):
-    def __init__(self, x: float, y: float, radius: float) -> None:
-        super().__init__(x, y, radius)
-        # Generate lumpy shape points
-        num_points = random.randint(8, 12)
-        self.shape_points = []
-        for i in range(num_points):
-            angle = (360 / num_points) * i
-            # Vary radius by up to 20%
-            offset = random.uniform(0.8, 1.2)
-            point_radius = radius * offset
-            self.shape_points.append((angle, point_radius))
+    boundary = WRAP_OUTSIDE
 
-    def draw(self, screen: pygame.Surface) -> None:
-        # Draw lumpy asteroid
-        points = []
-        for angle, point_radius in self.shape_points:
-            rad = math.radians(angle)
-            x = self.position.x + point_radius * math.cos(rad)
-            y = self.position.y + point_radius * math.sin(rad)
-            points.append((x, y))
-        if len(points) > 2:
-            pygame.draw.polygon(screen, "white", points, LINE_WIDTH)
+    def __init__(self, store: EntityStore, x: float, y: float, radius: float) -> None:
+        super().__init__(store, x, y, radius)
+        # Pick one of the precomputed lumpy shapes
+        self.shape_index: int = asteroid_shapes.pick()
 
-    def update(self, dt: float) -> None:
-        self.position += self.velocity * dt
-        # Wrap around screen
-        if self.position.x < -self.radius:
-            self.position.x = SCREEN_WIDTH + self.radius
-        elif self.position.x > SCREEN_WIDTH + self.radius:
-            self.position.x = -self.radius
-        if self.position.y < -self.radius:
-            self.position.y = SCREEN_HEIGHT + self.radius
-        elif self.position.y > SCREEN_HEIGHT + self.radius:
-            self.position.y = -self.radius
+    def draw(self, screen: pygame.Surface, scale: float = 1.0) -> None:
+        # Draw lumpy asteroid from its pre-rendered outline
+        surface = asteroid_shapes.surface(
+            self.radius, self.shape_index, governor.simple_outlines, scale
+        )
+        half = surface.get_width() // 2
+        x, y = self.position * scale
+        screen.blit(surface, (x - half, y - half))
+
+    @classmethod
+    def draw_all(
+        cls, screen: pygame.Surface, table: ComponentTable, scale: float = 1.0
+    ) -> None:
+        # One blits() call for the whole table, one cache lookup per outline
+        count = len(table)
+        simple = governor.simple_outlines
+        outlines: dict[tuple[float, int], tuple[pygame.Surface, int]] = {}
+        blits = []
+        for asteroid, (x, y), radius in zip(
+            table.entities,
+            (table.positions[:count] * scale).tolist(),
+            table.radii[:count].tolist(),
+        ):
+            key = (radius, asteroid.shape_index)
+            outline = outlines.get(key)
+            if outline is None:
+                surface = asteroid_shapes.surface(*key, simple, scale)
+                outline = outlines[key] = (surface, surface.get_width() // 2)
+            surface, half = outline
+            blits.append((surface, (x - half, y - half)))
+        screen.blits(blits, doreturn=False)
+
+    def draw_extent(self) -> float:
+        # Lumpy outlines reach up to 20% past the radius
+        return self.radius * 1.2
 
     def split(self) -> None:
         self.kill()
@@ -62,7 +67,8 @@ class Asteroid(CircleShape):
         b = self.velocity.rotate(-random_angle)
 
         new_radius = self.radius - ASTEROID_MIN_RADIUS
-        asteroid = Asteroid(self.position.x, self.position.y, new_radius)
+        position = self.position
+        asteroid = self.store.spawn(type(self), position.x, position.y, new_radius)
         asteroid.velocity = a * 1.2
-        asteroid = Asteroid(self.position.x, self.position.y, new_radius)
+        asteroid = self.store.spawn(type(self), position.x, position.y, new_radius)
         asteroid.velocity = b * 1.2
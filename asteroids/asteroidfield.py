@@ -12,9 +12,10 @@ from asteroids.constants import (
     SCREEN_HEIGHT,
     SCREEN_WIDTH,
 )
+from asteroids.entities import EntityStore
 
 
-class AsteroidField(pygame.sprite.Sprite):
+class AsteroidField:
     edges: list[tuple[pygame.Vector2, Callable[[float], pygame.Vector2]]] = [
         (
             pygame.Vector2(1, 0),
@@ -38,14 +39,14 @@ class AsteroidField(pygame.sprite.Sprite):
         ),
     ]
 
-    def __init__(self) -> None:
-        pygame.sprite.Sprite.__init__(self, self.containers)
+    def __init__(self, store: EntityStore) -> None:
+        self.store: EntityStore = store
         self.spawn_timer: float = 0.0
 
     def spawn(
         self, radius: float, position: pygame.Vector2, velocity: pygame.Vector2
     ) -> None:
-        asteroid: Asteroid = Asteroid(position.x, position.y, radius)
+        asteroid = self.store.spawn(Asteroid, position.x, position.y, radius)
         asteroid.velocity = velocity
 
     def update(self, dt: float) -> None:
@@ -0,0 +1,93 @@
+import math
+from collections.abc import Callable
+
+import pygame
+
+from asteroids.constants import SPRITE_ATLAS_ANGLE_STEP
+from asteroids.logger import log_event
+from asteroids.shapes import line_width
+
+# Draws a sprite around (center, center) at an angle in degrees and a scale
+Painter = Callable[[pygame.Surface, float, float, float], None]
+
+
+class SpriteAtlas:
+    """Small rotating sprites pre-rendered at every `step` degrees.
+
+    Sprites are registered by name with a painter and how far the drawing
+    reaches from the center. All rotations of a sprite at one scale are
+    rendered together the first time it is drawn, so afterwards drawing
+    is an index lookup and a blit. Sprites that look the same every
+    `period` degrees only render that many.
+    """
+
+    def __init__(self, step: float = SPRITE_ATLAS_ANGLE_STEP) -> None:
+        self.step: float = step
+        self.sprites: dict[str, tuple[Painter, float, float]] = {}
+        self.frames: dict[tuple[str, float], list[pygame.Surface]] = {}
+
+    def register(
+        self, name: str, painter: Painter, extent: float, period: float = 360.0
+    ) -> None:
+        self.sprites[name] = (painter, extent, period)
+        for key in [key for key in self.frames if key[0] == name]:
+            del self.frames[key]
+
+    def _render(self, name: str, scale: float) -> list[pygame.Surface]:
+        painter, extent, period = self.sprites[name]
+        half = math.ceil(extent * scale) + line_width(scale)
+        count = max(1, round(period / self.step))
+        frames = []
+        for i in range(count):
+            surface = pygame.Surface((half * 2, half * 2))
+            surface.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+            painter(surface, half, i * period / count, scale)
+            frames.append(surface)
+        self.frames[name, scale] = frames
+        log_event(
+            "sprite_atlas_built",
+            sprite=name,
+            scale=scale,
+            frames=count,
+            bytes=_footprint(frames),
+        )
+        return frames
+
+    def frame(self, name: str, angle: float, scale: float = 1.0) -> pygame.Surface:
+        """The pre-rendered rotation nearest to `angle`"""
+        frames = self.frames.get((name, scale))
+        if frames is None:
+            frames = self._render(name, scale)
+        period = self.sprites[name][2]
+        return frames[round(angle % period / period * len(frames)) % len(frames)]
+
+    def blit(
+        self,
+        screen: pygame.Surface,
+        name: str,
+        position: pygame.Vector2,
+        angle: float,
+        scale: float = 1.0,
+    ) -> None:
+        """Draw a sprite centered on a world position"""
+        surface = self.frame(name, angle, scale)
+        half = surface.get_width() // 2
+        screen.blit(surface, (position.x * scale - half, position.y * scale - half))
+
+    def stats(self) -> dict[str, int]:
+        """Rendered sprite sets, frames and their pixel memory in bytes"""
+        return {
+            "sets": len(self.frames),
+            "frames": sum(len(frames) for frames in self.frames.values()),
+            "bytes": sum(_footprint(frames) for frames in self.frames.values()),
+        }
+
+
+def _footprint(frames: list[pygame.Surface]) -> int:
+    return sum(
+        surface.get_width() * surface.get_height() * surface.get_bytesize()
+        for surface in frames
+    )
+
+
+sprite_atlas: SpriteAtlas = SpriteAtlas()
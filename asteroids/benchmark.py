@@ -0,0 +1,311 @@
+"""Benchmark the update, collision, snapshot and draw stages on synthetic stress worlds.
+
+    python -m asteroids.benchmark run --out bench.json
+    python -m asteroids.benchmark compare baseline.json bench.json
+
+`compare` exits with status 1 when a stage got slower than the threshold.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+import pygame
+
+from asteroids.atlas import sprite_atlas
+from asteroids.bomb import Bomb
+from asteroids.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from asteroids.explosion import Explosion
+from asteroids.headless import spawn_asteroids
+from asteroids.logger import configure_event_log
+from asteroids.main import (
+    check_collisions,
+    draw_background,
+    draw_world,
+    init_game,
+    update_game,
+)
+from asteroids.rewind import RewindBuffer
+from asteroids.shot import Shot
+
+STAGES: tuple[str, ...] = ("spawn", "update", "collision", "snapshot", "draw")
+_DT: float = 1 / 60
+
+
+def _top_up_shots(count: int) -> Callable[[dict, random.Random], None]:
+    # Keep `count` shots flying in random directions from random points
+    def spawn(game: dict, rng: random.Random) -> None:
+        for _ in range(count - len(game["shots"])):
+            shot = game["store"].spawn(
+                Shot, rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT)
+            )
+            shot.velocity = pygame.Vector2(0, 500).rotate(rng.uniform(0, 360))
+
+    return spawn
+
+
+def _detonate_bombs(count: int) -> Callable[[dict, random.Random], None]:
+    # Drop bombs that explode in this frame's collision pass
+    def spawn(game: dict, rng: random.Random) -> None:
+        for _ in range(count):
+            bomb = game["store"].spawn(
+                Bomb, rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT)
+            )
+            bomb.lifetime = 0.0
+
+    return spawn
+
+
+def _explosion_storm(count: int) -> Callable[[dict, random.Random], None]:
+    def spawn(game: dict, rng: random.Random) -> None:
+        for _ in range(count):
+            Explosion.create(
+                rng.uniform(0, SCREEN_WIDTH),
+                rng.uniform(0, SCREEN_HEIGHT),
+                game["particles"],
+            )
+
+    return spawn
+
+
+class Scenario:
+    """A synthetic world: pre-spawned asteroids plus a per-frame spawner"""
+
+    def __init__(
+        self,
+        asteroids: int,
+        spawn: Callable[[dict, random.Random], None] | None = None,
+        swept: bool = True,
+    ) -> None:
+        self.asteroids: int = asteroids
+        self.swept: bool = swept
+        self.spawn: Callable[[dict, random.Random], None] | None = spawn
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "asteroids_1k": Scenario(1_000),
+    "asteroids_5k": Scenario(5_000),
+    "asteroids_20k": Scenario(20_000),
+    "shots_500": Scenario(1_000, spawn=_top_up_shots(500)),
+    "shots_500_discrete": Scenario(1_000, spawn=_top_up_shots(500), swept=False),
+    "bombs_20_per_frame": Scenario(2_000, spawn=_detonate_bombs(20)),
+    "explosion_storm": Scenario(200, spawn=_explosion_storm(100)),
+}
+
+
+def _stats(samples: list[float]) -> dict[str, float]:
+    ms = np.array(samples) * 1000
+    return {
+        "mean_ms": round(float(ms.mean()), 4),
+        "median_ms": round(float(np.median(ms)), 4),
+        "p95_ms": round(float(np.percentile(ms, 95)), 4),
+    }
+
+
+def _time_stages(
+    scenario: Scenario, screen: pygame.Surface, frames: int, warmup: int, seed: int
+) -> tuple[dict[str, list[float]], dict]:
+    game = init_game(seed=seed, swept=scenario.swept)
+    spawn_asteroids(game["store"], scenario.asteroids)
+    rng = random.Random(seed)
+    rewind = RewindBuffer()
+
+    timings: dict[str, list[float]] = {stage: [] for stage in STAGES}
+    for frame in range(warmup + frames):
+        start = time.perf_counter()
+        if scenario.spawn is not None:
+            scenario.spawn(game, rng)
+        spawned = time.perf_counter()
+        update_game(game, _DT)
+        updated = time.perf_counter()
+        check_collisions(game)
+        collided = time.perf_counter()
+        rewind.record(game)
+        recorded = time.perf_counter()
+        draw_background(screen)
+        draw_world(screen, game)
+        drawn = time.perf_counter()
+
+        if frame >= warmup:
+            timings["spawn"].append(spawned - start)
+            timings["update"].append(updated - spawned)
+            timings["collision"].append(collided - updated)
+            timings["snapshot"].append(recorded - collided)
+            timings["draw"].append(drawn - recorded)
+    return timings, game
+
+
+def run_scenario(
+    scenario: Scenario,
+    screen: pygame.Surface,
+    frames: int = 60,
+    warmup: int = 10,
+    seed: int = 0,
+    repeats: int = 3,
+) -> dict[str, Any]:
+    """Time each stage per frame, keeping the best of `repeats` fresh worlds
+
+    Every repeat rebuilds the same seeded world; taking the repeat with the
+    lowest median per stage filters out interference from the rest of the
+    machine.
+    """
+    best: dict[str, dict[str, float]] = {}
+    for _ in range(repeats):
+        timings, game = _time_stages(scenario, screen, frames, warmup, seed)
+        for stage, samples in timings.items():
+            stats = _stats(samples)
+            if stage not in best or stats["median_ms"] < best[stage]["median_ms"]:
+                best[stage] = stats
+
+    return {
+        "stages": best,
+        "final_counts": {
+            name: len(game[name])
+            for name in ("asteroids", "shots", "bombs", "particles")
+        },
+        "pools": game["store"].pool_stats(),
+        "atlas": sprite_atlas.stats(),
+    }
+
+
+def run_benchmarks(
+    names: list[str],
+    frames: int = 60,
+    warmup: int = 10,
+    seed: int = 0,
+    repeats: int = 3,
+) -> dict[str, Any]:
+    """Run the named scenarios and return a JSON-serialisable report"""
+    pygame.display.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    configure_event_log(path=None)
+
+    results: dict[str, Any] = {}
+    for name in names:
+        print(f"{name}...", end=" ", file=sys.stderr, flush=True)
+        results[name] = run_scenario(
+            SCENARIOS[name], screen, frames, warmup, seed, repeats
+        )
+        total = sum(stage["median_ms"] for stage in results[name]["stages"].values())
+        print(f"{total:.2f} ms/frame", file=sys.stderr)
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "system": platform.system(),
+            "frames": frames,
+            "repeats": repeats,
+            "seed": seed,
+        },
+        "scenarios": results,
+    }
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float = 0.15,
+    min_delta_ms: float = 0.05,
+) -> list[str]:
+    """Print per-stage median changes and return the regressions
+
+    A stage regresses when its median is more than `threshold` slower than
+    the baseline and also at least `min_delta_ms` slower, so stages that
+    take microseconds don't fail on noise.
+    """
+    regressions: list[str] = []
+    print(f"{'scenario/stage':<36}{'baseline':>10}{'current':>10}{'change':>9}")
+    for name, result in current["scenarios"].items():
+        base = baseline["scenarios"].get(name)
+        if base is None:
+            print(f"{name:<36}{'(new)':>10}")
+            continue
+        for stage, stats in result["stages"].items():
+            if stage not in base["stages"]:
+                continue
+            old = base["stages"][stage]["median_ms"]
+            new = stats["median_ms"]
+            change = (new - old) / old if old > 0 else 0.0
+            regressed = change > threshold and new - old >= min_delta_ms
+            label = f"{name}/{stage}"
+            marker = "  REGRESSION" if regressed else ""
+            print(f"{label:<36}{old:>10.3f}{new:>10.3f}{change:>+9.1%}{marker}")
+            if regressed:
+                regressions.append(label)
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the benchmark scenarios")
+    run.add_argument("--out", default="benchmark.json", help="results JSON file")
+    run.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="scenario to run; repeatable, defaults to all",
+    )
+    run.add_argument("--frames", type=int, default=60, help="timed frames each")
+    run.add_argument("--warmup", type=int, default=10)
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument(
+        "--repeats", type=int, default=3, help="fresh runs per scenario, best kept"
+    )
+
+    diff = commands.add_parser("compare", help="diff results against a baseline")
+    diff.add_argument("baseline")
+    diff.add_argument("current")
+    diff.add_argument(
+        "--threshold",
+        type=float,
+        default=0.15,
+        help="allowed slowdown of a stage's median, 0.15 for 15%%",
+    )
+    diff.add_argument("--min-delta-ms", type=float, default=0.05)
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        report = run_benchmarks(
+            args.scenario or list(SCENARIOS),
+            args.frames,
+            args.warmup,
+            args.seed,
+            args.repeats,
+        )
+        os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.out}", file=sys.stderr)
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    regressions = compare(baseline, current, args.threshold, args.min_delta_ms)
+    if regressions:
+        print(f"{len(regressions)} stage(s) regressed: {', '.join(regressions)}")
+        sys.exit(1)
+    print("No regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,75 @@
+import math
+
 import pygame
 
+from asteroids.constants import LINE_WIDTH
+from asteroids.entities import (
+    WRAP,
+    ArrayScalar,
+    ArrayVector,
+    ComponentTable,
+    EntityStore,
+)
+
+
+class CircleShape:
+    """An entity whose motion components live in its store's table.
+
+    Subclasses define update(dt) only for per-entity logic; movement,
+    screen wrapping and lifetimes are run in batches by the store.
+    """
+
+    boundary: str = WRAP
+    integrate: bool = True  # Moved by the store along its velocity
+    expires: bool = False  # Lifetime counted down by the store
+    components: tuple[str, ...] = ("position", "velocity", "radius")
+
+    position = ArrayVector("positions")
+    velocity = ArrayVector("velocities")
+    radius = ArrayScalar("radii")
+
+    def __init__(self, store: EntityStore, x: float, y: float, radius: float) -> None:
+        self.store: EntityStore = store
+        self.table: ComponentTable = store.table(type(self))
+        self.slot: int = self.table.add(self, x, y, radius)
+
+    def alive(self) -> bool:
+        return self.slot >= 0
+
+    def kill(self) -> None:
+        if self.slot < 0:
+            return
+        # Keep the final state readable after removal, e.g. by split()
+        for name in self.components:
+            self.__dict__[name] = getattr(self, name)
+        self.table.remove(self.slot)
+        self.slot = -1
+        self.store.killed.append(self)
 
-class CircleShape(pygame.sprite.Sprite):
-    def __init__(self, x: float, y: float, radius: float) -> None:
-        if hasattr(self, "containers"):
-            super().__init__(self.containers)  # type: ignore
-        else:
-            super().__init__()
+    def draw(self, screen: pygame.Surface, scale: float = 1.0) -> None:
+        """Draw at `scale` times world coordinates, for scaled render targets"""
 
-        self.position: pygame.Vector2 = pygame.Vector2(x, y)
-        self.velocity: pygame.Vector2 = pygame.Vector2(0, 0)
-        self.radius: float = radius
+    @classmethod
+    def draw_all(
+        cls, screen: pygame.Surface, table: ComponentTable, scale: float = 1.0
+    ) -> None:
+        """Draw every entity of a table; override to batch the drawing"""
+        for entity in table.entities:
+            entity.draw(screen, scale)
 
-    def draw(self, screen: pygame.Surface) -> None:
-        pass
+    def draw_extent(self) -> float:
+        """Distance from the center that draw() may touch"""
+        return self.radius
 
-    def update(self, dt: float) -> None:
-        pass
+    def bounds(self) -> pygame.Rect:
+        """Screen area touched by draw(), used for dirty-rect rendering"""
+        extent = math.ceil(self.draw_extent()) + LINE_WIDTH + 1
+        return pygame.Rect(
+            int(self.position.x) - extent,
+            int(self.position.y) - extent,
+            extent * 2,
+            extent * 2,
+        )
 
     def collides_with(self, other) -> bool:
         return self.position.distance_to(other.position) <= self.radius + other.radius
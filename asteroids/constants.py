@@ -20,6 +20,40 @@ EXPLOSION_PARTICLES: int = 12
 POWERUP_SPAWN_RATE_SECONDS: float = 10.0
 POWERUP_DURATION: float = 10.0
 SHIELD_DURATION: float = 5.0
+POWERUP_RADIUS: int = 15
 SPEED_BOOST_MULTIPLIER: float = 1.5
 BOMB_RADIUS: int = 100
 BOMB_COOLDOWN: float = 3.0
+SPATIAL_HASH_CELL_SIZE: int = ASTEROID_MAX_RADIUS
+PARTICLE_CAPACITY: int = 1024
+PARTICLE_RADIUS: int = 3
+PARTICLE_FRICTION: float = 0.98
+ASTEROID_SHAPE_TEMPLATES: int = 8  # Lumpy outlines precomputed per radius
+# Max pre-rendered outline surfaces: every radius and template, full and simple
+ASTEROID_SHAPE_CACHE_SIZE: int = ASTEROID_KINDS * ASTEROID_SHAPE_TEMPLATES * 2
+SPRITE_ATLAS_ANGLE_STEP: float = 2.0  # Degrees between pre-rendered rotations
+STAR_COUNT: int = 100
+STARFIELD_PARALLAX_LAYERS: int = 0  # Extra scrolling star layers, 0 disables
+PARALLAX_STARS_PER_LAYER: int = 400
+HUD_TEXT_CACHE_SIZE: int = 128
+DIRTY_RECT_MAX_AREA: float = 0.5  # Fraction of the screen before a full flip
+SIM_TICK_RATE: int = 60  # Fixed simulation steps per second
+MAX_SIM_STEPS_PER_FRAME: int = 5  # Slow frames drop time beyond this
+RENDER_FPS_CAP: int = 60  # 0 renders as fast as the display allows
+IDLE_REDRAW_MS: int = 1000  # Idle screens present their frame again this often
+REWIND_CAPACITY: int = 10 * SIM_TICK_RATE  # Snapshots kept, one per sim step
+REWIND_KEYFRAME_INTERVAL: int = 30  # Snapshots per full keyframe
+REWIND_MAX_BYTES: int = 32 << 20  # Oldest snapshots are dropped beyond this
+PROFILER_FRAMES: int = 600  # Frames of phase timings kept for the overlay
+PROFILER_OVERLAY_REFRESH_FRAMES: int = 30
+SWEPT_COLLISIONS: bool = True  # Test shots against their whole path per step
+SHOT_POOL_SIZE: int = 128  # Shots preallocated at game start
+ASTEROID_POOL_SIZE: int = 256  # Asteroids preallocated at game start
+POOL_HIGH_WATER: int = 1024  # Idle entities kept per class for reuse
+QUALITY_WINDOW_FRAMES: int = 30  # Frames averaged before changing quality
+QUALITY_DEGRADE_RATIO: float = 0.9  # Of the frame budget, sheds quality above
+QUALITY_RESTORE_RATIO: float = 0.5  # Of the frame budget, restores quality below
+QUALITY_PARTICLE_FRACTION: float = 0.5  # Explosion particles kept when degraded
+QUALITY_LOG_THROTTLE: int = 4  # State snapshots this many times less often
+# Internal render resolution steps, as fractions of the window size
+RENDER_SCALES: tuple[float, ...] = (1.0, 0.875, 0.75, 0.625, 0.5)
@@ -0,0 +1,28 @@
+import pygame
+
+# Bits of the per-frame control mask
+THRUST: int = 1 << 0  # W
+TURN_LEFT: int = 1 << 1  # A
+TURN_RIGHT: int = 1 << 2  # D
+SHOOT: int = 1 << 3  # SPACE
+BOMB: int = 1 << 4  # B
+REWIND: int = 1 << 5  # BACKSPACE, held to play time backwards
+
+_KEY_BITS: tuple[tuple[int, int], ...] = (
+    (pygame.K_w, THRUST),
+    (pygame.K_a, TURN_LEFT),
+    (pygame.K_d, TURN_RIGHT),
+    (pygame.K_SPACE, SHOOT),
+    (pygame.K_b, BOMB),
+    (pygame.K_BACKSPACE, REWIND),
+)
+
+
+def read_controls() -> int:
+    """Pack the currently held game keys into a control mask"""
+    keys = pygame.key.get_pressed()
+    controls = 0
+    for key, bit in _KEY_BITS:
+        if keys[key]:
+            controls |= bit
+    return controls
@@ -0,0 +1,368 @@
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+import numpy as np
+import pygame
+
+from asteroids.constants import POOL_HIGH_WATER, SCREEN_HEIGHT, SCREEN_WIDTH
+
+# Boundary behaviours, set per entity class with its `boundary` attribute
+WRAP: str = "wrap"  # Jump to the opposite edge as soon as the center leaves
+WRAP_OUTSIDE: str = "wrap_outside"  # Jump once fully off screen
+CULL: str = "cull"  # Remove once fully off screen
+
+# An entity moving further than this in one step wrapped around the screen
+_WRAP_DISTANCE_SQUARED: float = (SCREEN_HEIGHT / 2) ** 2
+
+_COLUMNS: tuple[str, ...] = (
+    "positions",
+    "previous",
+    "velocities",
+    "radii",
+    "lifetimes",
+)
+
+
+class ComponentTable:
+    """Dense component arrays for the live entities of one class.
+
+    Row i holds the components of `entities[i]`. Removing an entity moves
+    the last row into its slot, so deletion is O(1) and the rows stay
+    packed for the batch systems below.
+    """
+
+    def __init__(self, cls: type, capacity: int = 64) -> None:
+        self.cls: type = cls
+        self.entities: list[Any] = []
+        self.positions: np.ndarray = np.zeros((capacity, 2))
+        self.previous: np.ndarray = np.zeros((capacity, 2))  # Before this step
+        self.velocities: np.ndarray = np.zeros((capacity, 2))
+        self.radii: np.ndarray = np.zeros(capacity)
+        self.lifetimes: np.ndarray = np.zeros(capacity)
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def __iter__(self) -> Iterator[Any]:
+        # Iterate over a copy so entities can be killed along the way
+        return iter(self.entities.copy())
+
+    def reserve(self, capacity: int) -> None:
+        """Make room for `capacity` rows up front"""
+        if capacity > len(self.radii):
+            self._grow(capacity)
+
+    def _grow(self, capacity: int = 0) -> None:
+        capacity = max(capacity, len(self.radii) * 2)
+        for name in _COLUMNS:
+            old = getattr(self, name)
+            new = np.zeros((capacity, *old.shape[1:]))
+            new[: len(old)] = old
+            setattr(self, name, new)
+
+    def add(self, entity: Any, x: float, y: float, radius: float) -> int:
+        slot = len(self.entities)
+        if slot == len(self.radii):
+            self._grow()
+        self.entities.append(entity)
+        self.positions[slot] = self.previous[slot] = (x, y)
+        self.velocities[slot] = 0.0
+        self.radii[slot] = radius
+        self.lifetimes[slot] = 0.0
+        return slot
+
+    def moved(self, slot: int) -> pygame.Vector2:
+        """How far a row moved in the last step, zero if it wrapped around"""
+        delta = pygame.Vector2(*(self.positions[slot] - self.previous[slot]))
+        if delta.length_squared() > _WRAP_DISTANCE_SQUARED:
+            return pygame.Vector2(0, 0)
+        return delta
+
+    def remove(self, slot: int) -> None:
+        last = len(self.entities) - 1
+        moved = self.entities.pop()
+        if slot != last:
+            self.positions[slot] = self.positions[last]
+            self.previous[slot] = self.previous[last]
+            self.velocities[slot] = self.velocities[last]
+            self.radii[slot] = self.radii[last]
+            self.lifetimes[slot] = self.lifetimes[last]
+            self.entities[slot] = moved
+            moved.slot = slot
+
+
+def behave(table: ComponentTable, dt: float) -> None:
+    """Run per-entity logic for classes that define update(dt)"""
+    if not hasattr(table.cls, "update"):
+        return
+    for entity in table.entities.copy():
+        if entity.slot >= 0:
+            entity.update(dt)
+
+
+def integrate(table: ComponentTable, dt: float) -> None:
+    """Move every entity by its velocity"""
+    count = len(table)
+    if count and table.cls.integrate:
+        table.positions[:count] += table.velocities[:count] * dt
+
+
+def age(table: ComponentTable, dt: float) -> None:
+    """Count down lifetimes of classes that expire"""
+    count = len(table)
+    if count and table.cls.expires:
+        table.lifetimes[:count] -= dt
+
+
+def apply_boundary(table: ComponentTable) -> None:
+    """Wrap or cull entities that left the screen"""
+    count = len(table)
+    if count == 0:
+        return
+    positions = table.positions[:count]
+    x = positions[:, 0]
+    y = positions[:, 1]
+    boundary = table.cls.boundary
+
+    if boundary == WRAP:
+        for axis, size in ((x, SCREEN_WIDTH), (y, SCREEN_HEIGHT)):
+            low = axis < 0
+            high = axis > size
+            axis[low] = size
+            axis[high] = 0
+        return
+
+    radii = table.radii[:count]
+    if boundary == WRAP_OUTSIDE:
+        for axis, size in ((x, SCREEN_WIDTH), (y, SCREEN_HEIGHT)):
+            low = axis < -radii
+            high = axis > size + radii
+            axis[low] = size + radii[low]
+            axis[high] = -radii[high]
+        return
+
+    outside = (
+        (x < -radii)
+        | (x > SCREEN_WIDTH + radii)
+        | (y < -radii)
+        | (y > SCREEN_HEIGHT + radii)
+    )
+    # Highest slot first, so the swap-removes never move a row that is
+    # still waiting to be culled
+    for slot in np.flatnonzero(outside)[::-1].tolist():
+        table.entities[slot].kill()
+
+
+def circles_touch(
+    a: ComponentTable,
+    a_rows: Sequence[int],
+    b: ComponentTable,
+    b_rows: Sequence[int],
+    dt: float = 0.0,
+) -> np.ndarray:
+    """Test row pairs of two tables for contact, one bool per pair
+
+    With a dt, both circles are swept back along their velocities over the
+    last dt seconds and a pair counts if they touched anywhere on the way,
+    so a fast shot can't skip over an asteroid between steps.
+    """
+    if len(a_rows) == 0:
+        return np.zeros(0, dtype=bool)
+    offsets = a.positions[a_rows] - b.positions[b_rows]
+    reach = a.radii[a_rows] + b.radii[b_rows]
+    if dt > 0:
+        motion = (a.velocities[a_rows] - b.velocities[b_rows]) * dt
+        offsets -= motion
+        # Closest approach along the relative path, clamped to the step
+        length_squared = (motion * motion).sum(axis=1)
+        along = -(offsets * motion).sum(axis=1)
+        t = np.divide(
+            along, length_squared, out=np.zeros_like(along), where=length_squared > 0
+        )
+        offsets += motion * np.clip(t, 0.0, 1.0)[:, None]
+    return (offsets * offsets).sum(axis=1) <= reach * reach
+
+
+class EntityPool:
+    """Killed entities of one class, kept for reuse by later spawns.
+
+    Acquiring runs `__init__` again on a pooled entity, resetting it in
+    place instead of building a new object. At most `high_water` idle
+    entities are kept; anything released beyond that is left to the GC.
+    """
+
+    def __init__(self, cls: type, high_water: int = POOL_HIGH_WATER) -> None:
+        self.cls: type = cls
+        self.high_water: int = high_water
+        self.free: list[Any] = []
+        self.hits: int = 0
+        self.misses: int = 0
+        self.discarded: int = 0
+
+    def preallocate(self, count: int) -> None:
+        """Fill the pool with up to `count` uninitialized entities"""
+        count = min(count, self.high_water)
+        while len(self.free) < count:
+            self.free.append(self.cls.__new__(self.cls))
+
+    def acquire(self, *args: Any) -> Any:
+        if self.free:
+            self.hits += 1
+            entity = self.free.pop()
+            entity.__init__(*args)
+            return entity
+        self.misses += 1
+        return self.cls(*args)
+
+    def release(self, entity: Any) -> None:
+        if len(self.free) < self.high_water:
+            self.free.append(entity)
+        else:
+            self.discarded += 1
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "free": len(self.free),
+            "hits": self.hits,
+            "misses": self.misses,
+            "discarded": self.discarded,
+        }
+
+
+class EntityStore:
+    """Every entity of one game, one ComponentTable per entity class.
+
+    Entities register themselves on construction, so a new game just needs
+    a new store. Tables are updated and drawn in the order they were
+    created. Entities made with spawn() come from a per-class EntityPool;
+    killed ones return to it at the start of the next update, as their
+    final state is still read during the step they die in.
+    """
+
+    def __init__(self, pool_high_water: int = POOL_HIGH_WATER) -> None:
+        self.tables: dict[type, ComponentTable] = {}
+        self.pools: dict[type, EntityPool] = {}
+        self.pool_high_water: int = pool_high_water
+        self.killed: list[Any] = []
+
+    def table(self, cls: type) -> ComponentTable:
+        table = self.tables.get(cls)
+        if table is None:
+            table = self.tables[cls] = ComponentTable(cls)
+        return table
+
+    def pool(self, cls: type) -> EntityPool:
+        pool = self.pools.get(cls)
+        if pool is None:
+            pool = self.pools[cls] = EntityPool(cls, self.pool_high_water)
+        return pool
+
+    def preallocate(self, cls: type, count: int) -> None:
+        """Reserve table rows and pooled entities for `count` of a class"""
+        self.table(cls).reserve(count)
+        self.pool(cls).preallocate(count)
+
+    def spawn(self, cls: type, *args: Any) -> Any:
+        """Create an entity of `cls` in this store, reusing a pooled one if any"""
+        return self.pool(cls).acquire(self, *args)
+
+    def pool_stats(self) -> dict[str, dict[str, int]]:
+        return {cls.__name__: pool.stats() for cls, pool in self.pools.items()}
+
+    def __len__(self) -> int:
+        return sum(len(table) for table in self.tables.values())
+
+    def __iter__(self) -> Iterator[Any]:
+        for table in list(self.tables.values()):
+            yield from table
+
+    def update(self, dt: float) -> None:
+        for entity in self.killed:
+            self.pool(type(entity)).release(entity)
+        self.killed.clear()
+
+        tables = list(self.tables.values())
+        for table in tables:
+            count = len(table)
+            table.previous[:count] = table.positions[:count]
+        for system in (behave, integrate, age):
+            for table in tables:
+                system(table, dt)
+        for table in tables:
+            apply_boundary(table)
+
+    def draw(self, screen: pygame.Surface, scale: float = 1.0) -> None:
+        """Draw every entity, at `scale` times world coordinates"""
+        for table in self.tables.values():
+            if table.entities:
+                table.cls.draw_all(screen, table, scale)
+
+    @contextmanager
+    def interpolated(self, alpha: float) -> Iterator[None]:
+        """Place entities between their last two positions until the block exits
+
+        Entities that wrapped around the screen in the last step are left
+        where they are rather than drawn streaking across it.
+        """
+        saved: list[tuple[ComponentTable, np.ndarray]] = []
+        for table in self.tables.values():
+            count = len(table)
+            if count == 0:
+                continue
+            current = table.positions[:count].copy()
+            previous = table.previous[:count]
+            delta = current - previous
+            smooth = (delta * delta).sum(axis=1) <= _WRAP_DISTANCE_SQUARED
+            table.positions[:count][smooth] = (previous + delta * alpha)[smooth]
+            saved.append((table, current))
+        try:
+            yield
+        finally:
+            for table, current in saved:
+                table.positions[: len(current)] = current
+
+
+class ArrayVector:
+    """Descriptor exposing an entity's row of a table column as a Vector2.
+
+    Reads return a copy, so assign the whole vector instead of mutating
+    `.x`/`.y` in place. Once killed, the entity keeps its final value in
+    the instance dict.
+    """
+
+    def __init__(self, column: str) -> None:
+        self.column: str = column
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name: str = name
+
+    def __get__(self, entity: Any, owner: type | None = None) -> Any:
+        if entity is None:
+            return self
+        if entity.slot < 0:
+            return entity.__dict__[self.name]
+        return pygame.Vector2(*getattr(entity.table, self.column)[entity.slot])
+
+    def __set__(self, entity: Any, value: pygame.Vector2) -> None:
+        if entity.slot < 0:
+            entity.__dict__[self.name] = pygame.Vector2(value)
+        else:
+            getattr(entity.table, self.column)[entity.slot] = value
+
+
+class ArrayScalar(ArrayVector):
+    """Descriptor exposing an entity's entry in a table column as a float"""
+
+    def __get__(self, entity: Any, owner: type | None = None) -> Any:
+        if entity is None:
+            return self
+        if entity.slot < 0:
+            return entity.__dict__[self.name]
+        return float(getattr(entity.table, self.column)[entity.slot])
+
+    def __set__(self, entity: Any, value: float) -> None:
+        if entity.slot < 0:
+            entity.__dict__[self.name] = value
+        else:
+            getattr(entity.table, self.column)[entity.slot] = value
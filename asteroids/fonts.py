@@ -0,0 +1,15 @@
+import pygame
+
+_fonts: dict[tuple[str | None, int], pygame.font.Font] = {}
+
+
+def get_font(size: int, face: str | None = None) -> pygame.font.Font:
+    """Font of a face (None for pygame's default) and size, loaded once
+
+    The cache lives for the whole process, so a restarted game reuses the
+    fonts of the last one instead of loading them from disk again.
+    """
+    font = _fonts.get((face, size))
+    if font is None:
+        font = _fonts[face, size] = pygame.font.Font(face, size)
+    return font
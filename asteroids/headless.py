@@ -0,0 +1,189 @@
+"""Headless fast-forward runner for soak-testing the game simulation."""
+
+import argparse
+import os
+import random
+import time
+from typing import Any
+
+import pygame
+
+from asteroids.asteroid import Asteroid
+from asteroids.constants import (
+    ASTEROID_KINDS,
+    ASTEROID_MIN_RADIUS,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+)
+from asteroids.entities import EntityStore
+from asteroids.main import check_collisions, init_game, update_game
+from asteroids.replay import Recording, world_digest
+
+# Keep pre-spawned asteroids this far away from the player's spawn point
+_SAFE_SPAWN_DISTANCE: float = 150.0
+
+
+def spawn_asteroids(store: EntityStore, count: int) -> None:
+    """Spawn `count` asteroids at random positions away from the player"""
+    center = pygame.Vector2(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
+    for _ in range(count):
+        position = center
+        while position.distance_to(center) < _SAFE_SPAWN_DISTANCE:
+            position = pygame.Vector2(
+                random.uniform(0, SCREEN_WIDTH), random.uniform(0, SCREEN_HEIGHT)
+            )
+        kind: int = random.randint(1, ASTEROID_KINDS)
+        asteroid = store.spawn(
+            Asteroid, position.x, position.y, ASTEROID_MIN_RADIUS * kind
+        )
+        asteroid.velocity = pygame.Vector2(0, random.randint(40, 100)).rotate(
+            random.uniform(0, 360)
+        )
+
+
+def run_headless(
+    frames: int,
+    dt: float = 1 / 60,
+    asteroids: int = 0,
+    seed: int | None = None,
+    stop_on_game_over: bool = True,
+) -> dict[str, Any]:
+    """Run the simulation without rendering or frame cap and return stats"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+
+    game = init_game(seed=seed)
+    spawn_asteroids(game["store"], asteroids)
+
+    frame = 0
+    game_over = False
+    peak_asteroids = len(game["asteroids"])
+    collision_pairs = 0
+    brute_force_pairs = 0
+    start = time.perf_counter()
+    while frame < frames:
+        pygame.event.pump()
+        update_game(game, dt)
+        brute_force_pairs += len(game["asteroids"]) * (len(game["shots"]) + 1)
+        game_over = check_collisions(game) or game_over
+        collision_pairs += game["collision_pairs"]
+        frame += 1
+        peak_asteroids = max(peak_asteroids, len(game["asteroids"]))
+        if game_over and stop_on_game_over:
+            break
+    elapsed = time.perf_counter() - start
+
+    fps = frame / elapsed if elapsed > 0 else float("inf")
+    return {
+        "frames": frame,
+        "sim_seconds": frame * dt,
+        "wall_seconds": elapsed,
+        "fps": fps,
+        "speedup": fps * dt,
+        "game_over": game_over,
+        "score": game["score"],
+        "asteroids": len(game["asteroids"]),
+        "peak_asteroids": peak_asteroids,
+        "collision_pairs_per_frame": collision_pairs / max(frame, 1),
+        "brute_force_pairs_per_frame": brute_force_pairs / max(frame, 1),
+        "pools": game["store"].pool_stats(),
+    }
+
+
+def run_replay(path: str) -> dict[str, Any]:
+    """Replay a recording as fast as possible and check the final state"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+
+    recording = Recording(path)
+    game = init_game(seed=recording.seed)
+
+    game_over = False
+    sim_seconds = 0.0
+    start = time.perf_counter()
+    for controls, dt in recording:
+        update_game(game, dt, controls)
+        sim_seconds += dt
+        game_over = check_collisions(game) or game_over
+    elapsed = time.perf_counter() - start
+
+    frames = len(recording)
+    fps = frames / elapsed if elapsed > 0 else float("inf")
+    return {
+        "frames": frames,
+        "sim_seconds": sim_seconds,
+        "wall_seconds": elapsed,
+        "fps": fps,
+        "speedup": sim_seconds / elapsed if elapsed > 0 else float("inf"),
+        "game_over": game_over,
+        "score": game["score"],
+        "asteroids": len(game["asteroids"]),
+        # None when the recording was never finished
+        "matches": (
+            None if recording.digest is None else world_digest(game) == recording.digest
+        ),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frames", type=int, default=60 * 60)
+    parser.add_argument("--dt", type=float, default=1 / 60)
+    parser.add_argument(
+        "--asteroids", type=int, default=0, help="asteroids to spawn up front"
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--keep-going",
+        action="store_true",
+        help="keep simulating after the player is destroyed",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="FILE",
+        help="replay a recording made with `--record` instead of simulating",
+    )
+    args = parser.parse_args(argv)
+
+    if args.replay:
+        stats = run_replay(args.replay)
+        print(
+            f"{stats['frames']} frames ({stats['sim_seconds']:.1f}s simulated) "
+            f"in {stats['wall_seconds']:.2f}s: {stats['fps']:.0f} fps, "
+            f"{stats['speedup']:.1f}x real time"
+        )
+        print(
+            f"score={stats['score']} asteroids={stats['asteroids']} "
+            f"game_over={stats['game_over']} world state matches: {stats['matches']}"
+        )
+        return
+
+    stats = run_headless(
+        args.frames,
+        dt=args.dt,
+        asteroids=args.asteroids,
+        seed=args.seed,
+        stop_on_game_over=not args.keep_going,
+    )
+    print(
+        f"{stats['frames']} frames ({stats['sim_seconds']:.1f}s simulated) "
+        f"in {stats['wall_seconds']:.2f}s: {stats['fps']:.0f} fps, "
+        f"{stats['speedup']:.1f}x real time"
+    )
+    print(
+        f"score={stats['score']} asteroids={stats['asteroids']} "
+        f"peak_asteroids={stats['peak_asteroids']} game_over={stats['game_over']}"
+    )
+    print(
+        f"collision pairs/frame: {stats['collision_pairs_per_frame']:.1f} "
+        f"(brute force {stats['brute_force_pairs_per_frame']:.1f})"
+    )
+    for name, pool in stats["pools"].items():
+        print(
+            f"{name} pool: {pool['hits']} reused, {pool['misses']} allocated, "
+            f"{pool['discarded']} discarded, {pool['free']} idle"
+        )
+
+
+if __name__ == "__main__":
+    main()
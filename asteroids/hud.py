@@ -0,0 +1,102 @@
+from collections import OrderedDict
+
+import pygame
+
+from asteroids.constants import HUD_TEXT_CACHE_SIZE, SCREEN_HEIGHT, SCREEN_WIDTH
+from asteroids.fonts import get_font
+from asteroids.powerup import PowerUpManager
+
+Color = tuple[int, int, int]
+
+
+class TextCache:
+    """Bounded LRU cache of rendered text surfaces"""
+
+    def __init__(self, max_entries: int = HUD_TEXT_CACHE_SIZE) -> None:
+        self.max_entries: int = max_entries
+        self.surfaces: OrderedDict[tuple[pygame.font.Font, str, Color], pygame.Surface]
+        self.surfaces = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def render(self, font: pygame.font.Font, text: str, color: Color) -> pygame.Surface:
+        key = (font, text, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+
+class Hud:
+    """Score, power-up timers and pause overlay drawn from cached surfaces"""
+
+    def __init__(self) -> None:
+        self.font: pygame.font.Font = get_font(48)
+        self.pause_font: pygame.font.Font = get_font(72)
+        self.text: TextCache = TextCache()
+
+        # Semi-transparent pause overlay, built once
+        self.overlay: pygame.Surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.overlay.set_alpha(128)
+        self.overlay.fill((0, 0, 0))
+
+    def _blit(
+        self,
+        screen: pygame.Surface,
+        font: pygame.font.Font,
+        text: str,
+        color: Color,
+        position: tuple[float, float],
+    ) -> pygame.Rect:
+        return screen.blit(self.text.render(font, text, color), position)
+
+    def draw_score(self, screen: pygame.Surface, score: int) -> pygame.Rect:
+        return self._blit(
+            screen, self.font, f"Score: {score}", (255, 255, 255), (10, 10)
+        )
+
+    def draw_pause(self, screen: pygame.Surface) -> pygame.Rect:
+        screen.blit(self.overlay, (0, 0))
+        pause_text = self.text.render(self.pause_font, "PAUSED", (255, 255, 255))
+        screen.blit(
+            pause_text,
+            pause_text.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)),
+        )
+        return self.overlay.get_rect()
+
+    def draw_powerups(
+        self, screen: pygame.Surface, powerup_manager: PowerUpManager
+    ) -> list[pygame.Rect]:
+        lines: list[tuple[str, Color]] = []
+        if powerup_manager.shield_active:
+            lines.append(
+                (f"Shield: {powerup_manager.shield_timer:.1f}s", (0, 150, 255))
+            )
+        if powerup_manager.speed_boost_active:
+            lines.append(
+                (
+                    f"Speed Boost: {powerup_manager.speed_boost_timer:.1f}s",
+                    (255, 200, 0),
+                )
+            )
+        if powerup_manager.rapid_fire_active:
+            lines.append(
+                (f"Rapid Fire: {powerup_manager.rapid_fire_timer:.1f}s", (255, 0, 0))
+            )
+        if powerup_manager.triple_shot_active:
+            lines.append(
+                (f"Triple Shot: {powerup_manager.triple_shot_timer:.1f}s", (0, 255, 0))
+            )
+
+        return [
+            self._blit(screen, self.font, text, color, (10, 60 + 40 * i))
+            for i, (text, color) in enumerate(lines)
+        ]
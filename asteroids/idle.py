@@ -0,0 +1,79 @@
+import time
+from collections.abc import Collection, Iterator
+from contextlib import contextmanager
+
+import pygame
+
+from asteroids.constants import IDLE_REDRAW_MS
+from asteroids.logger import log_event
+
+# Events that may have damaged the window contents
+_EXPOSE_EVENTS: frozenset[int] = frozenset(
+    (pygame.NOEVENT, pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+)
+
+
+def wait_for_key(
+    screen: pygame.Surface, keys: Collection[int], redraw_ms: int = IDLE_REDRAW_MS
+) -> int | None:
+    """Sleep until one of `keys` is pressed and return it, or None on quit
+
+    Whatever is on `screen` is presented once and kept as is; it is only
+    presented again when the window is exposed or every `redraw_ms`, so a
+    static screen costs next to no CPU while it waits.
+    """
+    frame = screen.copy()
+    pygame.display.flip()
+    while True:
+        event = pygame.event.wait(redraw_ms)
+        if event.type == pygame.QUIT:
+            return None
+        if event.type == pygame.KEYDOWN and event.key in keys:
+            return event.key
+        if event.type in _EXPOSE_EVENTS:
+            screen.blit(frame, (0, 0))
+            pygame.display.flip()
+
+
+class CpuMeter:
+    """Process CPU time against wall time, per named stretch of the game.
+
+    CPU usage is the share of one core, so a busy loop shows about 100%
+    and a screen that sleeps until input close to 0%.
+    """
+
+    def __init__(self) -> None:
+        # Name -> [wall seconds, CPU seconds]
+        self.totals: dict[str, list[float]] = {}
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[dict[str, float]]:
+        """Time the block; the yielded dict is filled in when it exits"""
+        usage: dict[str, float] = {}
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield usage
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+            totals = self.totals.setdefault(name, [0.0, 0.0])
+            totals[0] += wall
+            totals[1] += cpu
+            usage.update(_usage(wall, cpu))
+            log_event("cpu_usage", screen=name, **usage)
+
+    def report(self) -> dict[str, dict[str, float]]:
+        """Accumulated usage per name"""
+        return {name: _usage(*totals) for name, totals in self.totals.items()}
+
+
+def _usage(wall: float, cpu: float) -> dict[str, float]:
+    return {
+        "seconds": round(wall, 3),
+        "cpu_seconds": round(cpu, 3),
+        "cpu_percent": round(cpu / wall * 100, 1) if wall > 0 else 0.0,
+    }
+
+
+cpu_meter: CpuMeter = CpuMeter()
@@ -1,140 +1,299 @@
-import inspect
+import atexit
+import itertools
 import json
 import math
 import os
-import types
-from datetime import datetime
+import queue
+import threading
+import time
+from collections.abc import Callable
 from typing import Any
 
-__all__ = ["log_state", "log_event"]
+__all__ = [
+    "log_state",
+    "log_event",
+    "configure_event_log",
+    "close_event_log",
+    "event_log_stats",
+    "configure_state_log",
+    "register_group",
+    "register_sprite",
+    "register_extractor",
+    "clear_state_registry",
+]
 
 _FPS: int = 60
-_MAX_SECONDS: int = 16
+_SAMPLE_EVERY_FRAMES: int = _FPS  # Take a snapshot approx. once per second
+_MAX_SECONDS: float | None = None  # Stop state logging after this long
 _SPRITE_SAMPLE_LIMIT: int = 10  # Maximum number of sprites to log per group
 
+_STATE_LOG_PATH: str = "logs/game_state.jsonl"
+_EVENT_LOG_PATH: str = "logs/game_events.jsonl"
+_EVENT_QUEUE_SIZE: int = 4096
+_EVENT_BATCH_SIZE: int = 256  # Write once this many events are waiting...
+_EVENT_FLUSH_SECONDS: float = 0.5  # ...or this long after the last write
+_EVENT_QUEUE_POLICY: str = "drop"  # "drop" or "block" when the queue is full
+
 _frame_count: int = 0
 _state_log_initialized: bool = False
 _event_log_initialized: bool = False
-_start_time: datetime = datetime.now()
+_start_monotonic: float = time.monotonic()
+
+
+class _LogWriter(threading.Thread):
+    """Background thread writing JSON lines to a file in batches.
+
+    Records are handed over through a bounded queue. When it is full they
+    are either dropped or the caller blocks, depending on `policy`.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        path: str,
+        queue_size: int,
+        batch_size: int,
+        flush_seconds: float,
+        policy: str,
+        mode: str = "w",
+    ) -> None:
+        if policy not in ("drop", "block"):
+            raise ValueError(f"Unknown queue policy: {policy!r}")
+        super().__init__(name=f"log-writer:{path}", daemon=True)
+        self.path: str = path
+        self.batch_size: int = batch_size
+        self.flush_seconds: float = flush_seconds
+        self.policy: str = policy
+        self.mode: str = mode
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.queued: int = 0
+        self.written: int = 0
+        self.dropped: int = 0
+
+    def submit(self, record: dict[str, Any]) -> None:
+        if self.policy == "block":
+            self.queue.put(record)
+        else:
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self.dropped += 1
+                return
+        self.queued += 1
+
+    def close(self) -> None:
+        """Write everything still queued and stop the thread"""
+        self.queue.put(self._STOP)
+        self.join()
+
+    def run(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, self.mode) as f:
+            batch: list[str] = []
+            deadline = time.monotonic() + self.flush_seconds
+            while True:
+                try:
+                    record = self.queue.get(
+                        timeout=max(0.0, deadline - time.monotonic())
+                    )
+                except queue.Empty:
+                    record = None
+
+                stop = record is self._STOP
+                if record is not None and not stop:
+                    batch.append(json.dumps(record) + "\n")
+
+                if (
+                    stop
+                    or len(batch) >= self.batch_size
+                    or time.monotonic() >= deadline
+                ):
+                    if batch:
+                        f.writelines(batch)
+                        f.flush()
+                        self.written += len(batch)
+                        batch.clear()
+                    deadline = time.monotonic() + self.flush_seconds
+
+                if stop:
+                    return
+
+
+_event_writer: _LogWriter | None = None
+_event_log_path: str | None = _EVENT_LOG_PATH
+_event_writer_options: dict[str, Any] = {
+    "queue_size": _EVENT_QUEUE_SIZE,
+    "batch_size": _EVENT_BATCH_SIZE,
+    "flush_seconds": _EVENT_FLUSH_SECONDS,
+    "policy": _EVENT_QUEUE_POLICY,
+}
+
+
+def configure_event_log(**options: Any) -> None:
+    """Set path, queue_size, batch_size, flush_seconds or policy for event logging
+
+    Takes effect for the next event; a running writer is flushed first.
+    A path of None turns event logging off.
+    """
+    global _event_log_path
+    unknown = set(options) - set(_event_writer_options) - {"path"}
+    if unknown:
+        raise TypeError(f"Unknown event log options: {sorted(unknown)}")
+    close_event_log()
+    _event_log_path = options.pop("path", _event_log_path)
+    _event_writer_options.update(options)
+
+
+def close_event_log() -> None:
+    """Flush pending events and stop the writer thread"""
+    global _event_writer
+    if _event_writer is not None:
+        _event_writer.close()
+        _event_writer = None
+
+
+def event_log_stats() -> dict[str, int]:
+    """Counters of events queued, written and dropped by the current writer"""
+    if _event_writer is None:
+        return {"queued": 0, "written": 0, "dropped": 0, "pending": 0}
+    return {
+        "queued": _event_writer.queued,
+        "written": _event_writer.written,
+        "dropped": _event_writer.dropped,
+        "pending": _event_writer.queue.qsize(),
+    }
 
 
-def log_state() -> None:
-    global _frame_count, _state_log_initialized
+_state_writer: _LogWriter | None = None
+_state_options: dict[str, Any] = {
+    "sample_every_frames": _SAMPLE_EVERY_FRAMES,
+    "throttle": 1,  # Multiplies sample_every_frames, e.g. under heavy load
+    "sprite_limit": _SPRITE_SAMPLE_LIMIT,
+    "max_seconds": _MAX_SECONDS,
+}
+_groups: dict[str, Any] = {}
+_sprites: dict[str, Any] = {}
+_extractors: dict[type, Callable[[Any], dict[str, Any]]] = {}
+_extractor_cache: dict[type, Callable[[Any], dict[str, Any]]] = {}
 
-    # Stop logging after `_MAX_SECONDS` seconds
-    if _frame_count > _FPS * _MAX_SECONDS:
-        return
 
-    # Take a snapshot approx. once per second
-    _frame_count += 1
-    if _frame_count % _FPS != 0:
-        return
+def _close_state_log() -> None:
+    global _state_writer
+    if _state_writer is not None:
+        _state_writer.close()
+        _state_writer = None
 
-    now: datetime = datetime.now()
 
-    frame: types.FrameType | None = inspect.currentframe()
-    if frame is None:
-        return
+def _shutdown() -> None:
+    close_event_log()
+    _close_state_log()
 
-    frame_back: types.FrameType | None = frame.f_back
-    if frame_back is None:
-        return
 
-    local_vars: dict[str, Any] = frame_back.f_locals.copy()
+atexit.register(_shutdown)
 
-    screen_size: tuple[int, int] | list[int] = []
-    game_state: dict[str, Any] = {}
 
-    for key, value in local_vars.items():
-        if "pygame" in str(type(value)) and hasattr(value, "get_size"):
-            screen_size = value.get_size()
+def configure_state_log(**options: Any) -> None:
+    """Set sample_every_frames, throttle, sprite_limit or max_seconds for log_state()
 
-        if hasattr(value, "__class__") and "Group" in value.__class__.__name__:
-            sprites_data: list[dict[str, Any]] = []
+    A max_seconds of None keeps state logging on for the whole session.
+    """
+    unknown = set(options) - set(_state_options)
+    if unknown:
+        raise TypeError(f"Unknown state log options: {sorted(unknown)}")
+    _state_options.update(options)
 
-            for i, sprite in enumerate(value):
-                if i >= _SPRITE_SAMPLE_LIMIT:
-                    break
 
-                sprite_info: dict[str, Any] = {"type": sprite.__class__.__name__}
+def register_group(name: str, group: Any) -> None:
+    """Include a sprite group's count and sampled sprites in state snapshots"""
+    _groups[name] = group
 
-                if hasattr(sprite, "position"):
-                    sprite_info["pos"] = [
-                        round(sprite.position.x, 2),
-                        round(sprite.position.y, 2),
-                    ]
 
-                if hasattr(sprite, "velocity"):
-                    sprite_info["vel"] = [
-                        round(sprite.velocity.x, 2),
-                        round(sprite.velocity.y, 2),
-                    ]
+def register_sprite(name: str, sprite: Any) -> None:
+    """Include a single object, e.g. the player, in state snapshots"""
+    _sprites[name] = sprite
 
-                if hasattr(sprite, "radius"):
-                    sprite_info["rad"] = sprite.radius
 
-                if hasattr(sprite, "rotation"):
-                    sprite_info["rot"] = round(sprite.rotation, 2)
+def register_extractor(cls: type, extractor: Callable[[Any], dict[str, Any]]) -> None:
+    """Serialize instances of `cls` and its subclasses with `extractor`"""
+    _extractors[cls] = extractor
+    _extractor_cache.clear()
 
-                sprites_data.append(sprite_info)
 
-            game_state[key] = {"count": len(value), "sprites": sprites_data}
+def clear_state_registry() -> None:
+    """Forget registered groups and sprites, e.g. before a new game"""
+    _groups.clear()
+    _sprites.clear()
 
-        if len(game_state) == 0 and hasattr(value, "position"):
-            sprite_info: dict[str, Any] = {"type": value.__class__.__name__}
 
-            sprite_info["pos"] = [
-                round(value.position.x, 2),
-                round(value.position.y, 2),
-            ]
+def _extract(obj: Any) -> dict[str, Any]:
+    cls = type(obj)
+    extractor = _extractor_cache.get(cls)
+    if extractor is None:
+        extractor = next(
+            (_extractors[base] for base in cls.__mro__ if base in _extractors),
+            lambda obj: {"type": type(obj).__name__},
+        )
+        _extractor_cache[cls] = extractor
+    return extractor(obj)
 
-            if hasattr(value, "velocity"):
-                sprite_info["vel"] = [
-                    round(value.velocity.x, 2),
-                    round(value.velocity.y, 2),
-                ]
 
-            if hasattr(value, "radius"):
-                sprite_info["rad"] = value.radius
+def log_state() -> None:
+    global _frame_count, _state_writer, _state_log_initialized
 
-            if hasattr(value, "rotation"):
-                sprite_info["rot"] = round(value.rotation, 2)
+    _frame_count += 1
+    interval: int = _state_options["sample_every_frames"] * _state_options["throttle"]
+    if _frame_count % interval != 0:
+        return
 
-            game_state[key] = sprite_info
+    elapsed: float = time.monotonic() - _start_monotonic
+    max_seconds: float | None = _state_options["max_seconds"]
+    if max_seconds is not None and elapsed > max_seconds:
+        return
 
     entry: dict[str, Any] = {
-        "timestamp": now.strftime("%H:%M:%S.%f")[:-3],
-        "elapsed_s": math.floor((now - _start_time).total_seconds()),
+        "t": round(elapsed, 3),
+        "elapsed_s": math.floor(elapsed),
         "frame": _frame_count,
-        "screen_size": screen_size,
-        **game_state,
     }
-
-    # New log file on each run
-    mode: str = "w" if not _state_log_initialized else "a"
-    os.makedirs("logs", exist_ok=True)
-    with open("logs/game_state.jsonl", mode) as f:
-        f.write(json.dumps(entry) + "\n")
-
-    _state_log_initialized = True
+    limit: int = _state_options["sprite_limit"]
+    for name, group in _groups.items():
+        sample = itertools.islice(group, limit)
+        entry[name] = {
+            "count": len(group),
+            "sprites": [_extract(sprite) for sprite in sample],
+        }
+    for name, sprite in _sprites.items():
+        entry[name] = _extract(sprite)
+
+    if _state_writer is None:
+        # New log file on each run
+        mode: str = "w" if not _state_log_initialized else "a"
+        _state_writer = _LogWriter(_STATE_LOG_PATH, mode=mode, **_event_writer_options)
+        _state_writer.start()
+        _state_log_initialized = True
+    _state_writer.submit(entry)
 
 
 def log_event(event_type: str, **details: Any) -> None:
-    global _event_log_initialized
-
-    now: datetime = datetime.now()
+    global _event_writer, _event_log_initialized
 
-    event: dict[str, Any] = {
-        "timestamp": now.strftime("%H:%M:%S.%f")[:-3],
-        "elapsed_s": math.floor((now - _start_time).total_seconds()),
-        "frame": _frame_count,
-        "type": event_type,
-        **details,
-    }
-
-    mode: str = "w" if not _event_log_initialized else "a"
-    os.makedirs("logs", exist_ok=True)
-    with open("logs/game_events.jsonl", mode) as f:
-        f.write(json.dumps(event) + "\n")
-
-    _event_log_initialized = True
+    if _event_log_path is None:
+        return
+    if _event_writer is None:
+        # New log file on each run
+        mode: str = "w" if not _event_log_initialized else "a"
+        _event_writer = _LogWriter(_event_log_path, mode=mode, **_event_writer_options)
+        _event_writer.start()
+        _event_log_initialized = True
+
+    elapsed: float = time.monotonic() - _start_monotonic
+    _event_writer.submit(
+        {
+            "t": round(elapsed, 3),
+            "elapsed_s": math.floor(elapsed),
+            "frame": _frame_count,
+            "type": event_type,
+            **details,
+        }
+    )
@@ -1,49 +1,126 @@
+# Imported first so the startup report can time the imports below
+from asteroids.startup import startup
+
+import argparse
+import itertools
+import numpy as np
 import pygame
 import random
+import time
+from typing import Any
 
 from asteroids.asteroid import Asteroid
 from asteroids.asteroidfield import AsteroidField
 from asteroids.bomb import Bomb
+from asteroids.circleshape import CircleShape
+from asteroids.controls import BOMB, REWIND, read_controls
+from asteroids.entities import ComponentTable, EntityStore, circles_touch
 from asteroids.constants import (
+    ASTEROID_POOL_SIZE,
     BOMB_RADIUS,
     POINTS_PER_ASTEROID,
     POWERUP_SPAWN_RATE_SECONDS,
+    RENDER_FPS_CAP,
+    RENDER_SCALES,
     SCREEN_HEIGHT,
     SCREEN_WIDTH,
+    SHOT_POOL_SIZE,
+    SIM_TICK_RATE,
+    SWEPT_COLLISIONS,
+)
+from asteroids.explosion import Explosion
+from asteroids.fonts import get_font
+from asteroids.hud import Hud
+from asteroids.idle import cpu_meter, wait_for_key
+from asteroids.logger import (
+    clear_state_registry,
+    log_event,
+    log_state,
+    register_extractor,
+    register_group,
+    register_sprite,
 )
-from asteroids.explosion import Explosion, ExplosionParticle
-from asteroids.logger import log_event, log_state
+from asteroids.particles import ParticleSystem
 from asteroids.player import Player
 from asteroids.powerup import PowerUp, PowerUpManager
+from asteroids.profiler import profiler
+from asteroids.quality import LEVELS, QualityGovernor, governor
+from asteroids.renderer import DirtyRectRenderer
+from asteroids.replay import Recorder, Recording, world_digest
+from asteroids.resolution import ResolutionScaler
+from asteroids.rewind import RewindBuffer
 from asteroids.shot import Shot
+from asteroids.spatialhash import SpatialHash
+from asteroids.starfield import BACKGROUND_COLOR, Starfield
+from asteroids.timestep import FixedTimestep
+
+
+_starfield: Starfield | None = None
+# Entity counts shown on the profiler overlay
+_OVERLAY_GROUPS: tuple[str, ...] = (
+    "asteroids",
+    "shots",
+    "bombs",
+    "powerups",
+    "particles",
+)
+
+
+def _sprite_fields(sprite: CircleShape) -> dict[str, Any]:
+    position = sprite.position
+    velocity = sprite.velocity
+    return {
+        "type": type(sprite).__name__,
+        "pos": [round(position.x, 2), round(position.y, 2)],
+        "vel": [round(velocity.x, 2), round(velocity.y, 2)],
+        "rad": sprite.radius,
+    }
+
+
+def _rotating_fields(sprite: Player | PowerUp) -> dict[str, Any]:
+    fields = _sprite_fields(sprite)
+    fields["rot"] = round(sprite.rotation, 2)
+    return fields
+
+
+def _quality_fields(quality: QualityGovernor) -> dict[str, Any]:
+    return {
+        "level": quality.level,
+        "quality": quality.name,
+        "frame_ms": round(quality.average * 1000, 2),
+    }
+
 
+register_extractor(CircleShape, _sprite_fields)
+register_extractor(Player, _rotating_fields)
+register_extractor(PowerUp, _rotating_fields)
+register_extractor(QualityGovernor, _quality_fields)
 
-_starfield_cache = None
 
+def get_starfield() -> Starfield:
+    """Return the background starfield, rendering it on first use"""
+    global _starfield
+    if _starfield is None:
+        _starfield = Starfield()
+    return _starfield
 
-def draw_background(screen: pygame.Surface) -> None:
-    """Draw a starfield background"""
-    global _starfield_cache
-    if _starfield_cache is None:
-        # Generate starfield once
-        _starfield_cache = []
-        for _ in range(100):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_HEIGHT)
-            brightness = random.randint(100, 255)
-            _starfield_cache.append((x, y, brightness))
 
-    screen.fill((10, 10, 20))  # Dark blue-black background
-    # Draw stars
-    for x, y, brightness in _starfield_cache:
-        pygame.draw.circle(screen, (brightness, brightness, brightness), (x, y), 1)
+def draw_background(
+    screen: pygame.Surface, offset: pygame.Vector2 | None = None
+) -> None:
+    """Draw a starfield background, scrolling parallax layers by offset"""
+    if not governor.draw_starfield:
+        # Shed by the quality governor
+        screen.fill(BACKGROUND_COLOR)
+        return
+    get_starfield().draw(screen, offset)
 
 
 def show_game_over_screen(screen: pygame.Surface, score: int) -> bool:
     """Show game over screen, return True if player wants to restart"""
-    font_large = pygame.font.Font(None, 72)
-    font_medium = pygame.font.Font(None, 48)
-    font_small = pygame.font.Font(None, 36)
+    font_large = get_font(72)
+    font_medium = get_font(48)
+    font_small = get_font(36)
 
     game_over_text = font_large.render("GAME OVER", True, (255, 0, 0))
     score_text = font_medium.render(f"Final Score: {score}", True, (255, 255, 255))
@@ -59,251 +136,545 @@ def show_game_over_screen(screen: pygame.Surface, score: int) -> bool:
         center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 100)
     )
 
-    while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return False
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_r:
-                    return True
-                if event.key == pygame.K_q:
-                    return False
-
-        screen.fill((0, 0, 0))
-        screen.blit(game_over_text, game_over_rect)
-        screen.blit(score_text, score_rect)
-        screen.blit(restart_text, restart_rect)
-        pygame.display.flip()
-
-
-def init_game():
-    """Initialize game objects and return them"""
-    updatable: pygame.sprite.Group = pygame.sprite.Group()
-    drawable: pygame.sprite.Group = pygame.sprite.Group()
-    asteroids: pygame.sprite.Group = pygame.sprite.Group()
-    shots: pygame.sprite.Group = pygame.sprite.Group()
-    powerups: pygame.sprite.Group = pygame.sprite.Group()
-    bombs: pygame.sprite.Group = pygame.sprite.Group()
-    explosions: pygame.sprite.Group = pygame.sprite.Group()
-
-    Asteroid.containers = (asteroids, updatable, drawable)  # type: ignore
-    Shot.containers = (shots, updatable, drawable)  # type: ignore
-    Bomb.containers = (bombs, updatable, drawable)  # type: ignore
-    PowerUp.containers = (powerups, updatable, drawable)  # type: ignore
-    ExplosionParticle.containers = (explosions, updatable, drawable)  # type: ignore
-
-    AsteroidField.containers = updatable  # type: ignore
-    AsteroidField()  # type: ignore
-
-    Player.containers = (updatable, drawable)  # type: ignore
-    player: Player = Player(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
+    # Nothing changes until R or Q, so draw once and sleep until then
+    screen.fill((0, 0, 0))
+    screen.blit(game_over_text, game_over_rect)
+    screen.blit(score_text, score_rect)
+    screen.blit(restart_text, restart_rect)
+    return wait_for_key(screen, (pygame.K_r, pygame.K_q)) == pygame.K_r
+
+
+def init_game(seed: int | None = None, swept: bool = SWEPT_COLLISIONS):
+    """Initialize game objects and return them
+
+    Every entity lives in the game's EntityStore, so starting a new game
+    leaves nothing behind from the previous one. A `seed` makes the whole
+    simulation reproducible, e.g. for replays. With `swept`, shots hit
+    anything they passed during the step, not just what they overlap at
+    its end.
+    """
+    if seed is not None:
+        random.seed(seed)
+
+    store = EntityStore()
+    # Tables are drawn in creation order, the player on top
+    asteroids = store.table(Asteroid)
+    shots = store.table(Shot)
+    bombs = store.table(Bomb)
+    powerups = store.table(PowerUp)
+    store.preallocate(Asteroid, ASTEROID_POOL_SIZE)
+    store.preallocate(Shot, SHOT_POOL_SIZE)
+    # At most one bomb every few seconds and one power-up at a time
+    store.preallocate(Bomb, 4)
+    store.preallocate(PowerUp, 2)
+
+    particles: ParticleSystem = ParticleSystem()
+    if seed is not None:
+        particles.rng = np.random.default_rng(seed)
+
+    asteroid_field = AsteroidField(store)
+    player: Player = Player(store, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
+
+    clear_state_registry()
+    register_group("entities", store)
+    register_group("asteroids", asteroids)
+    register_group("shots", shots)
+    register_group("powerups", powerups)
+    register_group("bombs", bombs)
+    register_sprite("player", player)
+    register_sprite("quality", governor)
 
     return {
-        "updatable": updatable,
-        "drawable": drawable,
+        "store": store,
         "asteroids": asteroids,
         "shots": shots,
         "powerups": powerups,
         "bombs": bombs,
-        "explosions": explosions,
+        "particles": particles,
         "player": player,
+        "asteroid_field": asteroid_field,
+        "powerup_manager": PowerUpManager(),
+        "score": 0,
+        "powerup_spawn_timer": 0.0,
+        "asteroid_grid": SpatialHash(),
+        "powerup_grid": SpatialHash(),
+        "collision_pairs": 0,
+        "swept": swept,
+        "step_dt": 0.0,  # Length of the last update, for swept collisions
     }
 
 
-def main() -> None:
-    pygame.init()
+def update_game(game: dict, dt: float, controls: int = 0) -> None:
+    """Advance the simulation by dt seconds with the given control mask"""
+    powerups = game["powerups"]
+    player = game["player"]
+    powerup_manager = game["powerup_manager"]
+
+    # Update power-up manager
+    powerup_manager.update(dt)
+    player.shield_active = powerup_manager.shield_active
+    player.speed_boost_active = powerup_manager.speed_boost_active
+    player.rapid_fire_active = powerup_manager.rapid_fire_active
+    player.triple_shot_active = powerup_manager.triple_shot_active
+
+    player.controls = controls
+
+    # Handle bomb dropping
+    if controls & BOMB:
+        player.drop_bomb()
+
+    game["particles"].update(dt)
+    game["store"].update(dt)
+    # Spawned after the systems ran, so new asteroids start moving next step
+    game["asteroid_field"].update(dt)
+    game["step_dt"] = dt
+
+    # Spawn power-ups (only when not paused)
+    game["powerup_spawn_timer"] += dt
+    if game["powerup_spawn_timer"] > POWERUP_SPAWN_RATE_SECONDS and len(powerups) == 0:
+        game["powerup_spawn_timer"] = 0
+        x = random.randint(50, SCREEN_WIDTH - 50)
+        y = random.randint(50, SCREEN_HEIGHT - 50)
+        game["store"].spawn(PowerUp, x, y)
+
+
+def draw_world(screen: pygame.Surface, game: dict, scale: float = 1.0) -> None:
+    """Draw particles and then every entity, at `scale` times world coordinates"""
+    game["particles"].draw(screen, scale)
+    game["store"].draw(screen, scale)
+
+
+def _rebuild_grid(grid: SpatialHash, table: ComponentTable) -> None:
+    grid.rebuild_from_arrays(
+        table.entities, table.positions, table.radii, table.velocities
+    )
+
+
+def rebuild_asteroid_grid(game: dict) -> None:
+    """Refresh the asteroid broadphase grid from the current asteroids"""
+    _rebuild_grid(game["asteroid_grid"], game["asteroids"])
+
+
+def check_collisions(game: dict) -> bool:
+    """Resolve collisions, return True if the player was destroyed"""
+    asteroids = game["asteroids"]
+    shots = game["shots"]
+    powerups = game["powerups"]
+    bombs = game["bombs"]
+    particles = game["particles"]
+    player = game["player"]
+    powerup_manager = game["powerup_manager"]
+    asteroid_grid = game["asteroid_grid"]
+    game_over = False
+    pairs = 0
+
+    rebuild_asteroid_grid(game)
+    profiler.lap("broadphase")
+
+    # Check collisions: player vs asteroids
+    # The triangle's rear corners stick out to ~1.2x the player's radius
+    candidates = asteroid_grid.query(player.position, player.radius * 1.5)
+    pairs += len(candidates)
+    for asteroid in candidates:
+        if player.shield_active:
+            # Shield protects from one hit
+            if asteroid.collides_with(player):
+                log_event("player_hit_shield")
+                asteroid.split()
+                game["score"] += POINTS_PER_ASTEROID
+                Explosion.create(asteroid.position.x, asteroid.position.y, particles)
+                powerup_manager.shield_active = False
+                player.shield_active = False
+                rebuild_asteroid_grid(game)
+        else:
+            # Use triangular hitbox
+            if player.collides_with_triangle(asteroid):
+                log_event("player_hit")
+                game_over = True
+                break
+    profiler.lap("collide_player")
+
+    # Check collisions: shots vs asteroids
+    # Gather candidate pairs from the grid and test them in one batch
+    swept = game["swept"]
+    dt = game["step_dt"] if swept else 0.0
+    count = len(shots)
+    reaches = shots.radii[:count]
+    if swept:
+        # Widen the query by how far shot and asteroids moved this step
+        speeds = np.hypot(shots.velocities[:count, 0], shots.velocities[:count, 1])
+        reaches = reaches + (speeds + asteroid_grid.max_speed) * dt
+    candidates = [
+        asteroid_grid.query_indices_at(x, y, reach)
+        for (x, y), reach in zip(shots.positions[:count].tolist(), reaches.tolist())
+    ]
+    shot_rows = np.repeat(np.arange(count), [len(found) for found in candidates])
+    asteroid_rows = list(itertools.chain.from_iterable(candidates))
+    pairs += len(asteroid_rows)
+    touching = circles_touch(shots, shot_rows, asteroids, asteroid_rows, dt)
+
+    # Resolve hits in asteroid order, each asteroid taking the first shot
+    hits: dict[int, list[Shot]] = {}
+    for row, index in zip(
+        shot_rows[touching].tolist(), np.array(asteroid_rows)[touching].tolist()
+    ):
+        hits.setdefault(index, []).append(shots.entities[row])
+    for index in sorted(hits):
+        asteroid = asteroid_grid.sprites[index]
+        for shot in hits[index]:
+            if shot.alive():
+                log_event("asteroid_shot")
+                shot.kill()
+                asteroid.split()
+                game["score"] += POINTS_PER_ASTEROID
+                Explosion.create(asteroid.position.x, asteroid.position.y, particles)
+                break
+    profiler.lap("collide_shots")
+
+    # Check collisions: bombs vs asteroids
+    exploded = np.flatnonzero(bombs.lifetimes[: len(bombs)] <= 0).tolist()
+    stale = True  # Whether asteroids split since the grid was built
+    for bomb in [bombs.entities[row] for row in exploded]:
+        # Bomb exploded, destroy nearby asteroids
+        if stale:
+            rebuild_asteroid_grid(game)
+        position = bomb.position
+        indices = asteroid_grid.query_indices(position, BOMB_RADIUS)
+        pairs += len(indices)
+        offsets = asteroids.positions[indices] - (position.x, position.y)
+        inside = (offsets * offsets).sum(axis=1) <= BOMB_RADIUS * BOMB_RADIUS
+        destroyed = np.array(indices, dtype=int)[inside].tolist()
+        for index in destroyed:
+            asteroid = asteroid_grid.sprites[index]
+            log_event("asteroid_destroyed_by_bomb")
+            asteroid.split()
+            game["score"] += POINTS_PER_ASTEROID
+            Explosion.create(asteroid.position.x, asteroid.position.y, particles)
+        stale = bool(destroyed)
+        Explosion.create(position.x, position.y, particles)
+        bomb.kill()
+    profiler.lap("collide_bombs")
+
+    # Check collisions: player vs power-ups
+    _rebuild_grid(game["powerup_grid"], powerups)
+    candidates = game["powerup_grid"].query(player.position, player.radius)
+    pairs += len(candidates)
+    for powerup in candidates:
+        if powerup.collides_with(player):
+            log_event("powerup_collected", powerup=powerup.powerup_type)
+            powerup_manager.activate(powerup.powerup_type)
+            powerup.kill()
+    profiler.lap("collide_powerups")
+
+    game["collision_pairs"] = pairs
+    return game_over
+
+
+def _render_scale(value: str) -> str | float:
+    if value == "auto":
+        return value
+    try:
+        scale = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a number or 'auto': {value!r}")
+    if not min(RENDER_SCALES) <= scale <= 1.0:
+        raise argparse.ArgumentTypeError(
+            f"must be between {min(RENDER_SCALES)} and 1.0, got {scale}"
+        )
+    return scale
+
+
+def _report_startup(kind: str, show: bool) -> None:
+    report = startup.report()
+    log_event(kind, **report)
+    if show:
+        phases = ", ".join(f"{phase} {ms:.1f}" for phase, ms in report.items())
+        print(f"{kind.capitalize()} latency (ms): {phases}")
+
+
+def _report_cpu(screen_name: str, usage: dict[str, float], show: bool) -> None:
+    if show:
+        print(
+            f"{screen_name}: {usage['cpu_percent']:.1f}% CPU "
+            f"over {usage['seconds']:.1f}s"
+        )
+
+
+def main(argv: list[str] | None = None) -> None:
+    startup.lap("import")
+    parser = argparse.ArgumentParser(description="Asteroids")
+    parser.add_argument(
+        "--dirty-rects",
+        action="store_true",
+        help="only repaint and present the screen regions that changed",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="seed the game's random state"
+    )
+    parser.add_argument(
+        "--record", metavar="FILE", help="record the first game's input to FILE"
+    )
+    parser.add_argument(
+        "--replay", metavar="FILE", help="play back a recording made with --record"
+    )
+    parser.add_argument(
+        "--tick-rate",
+        type=float,
+        default=SIM_TICK_RATE,
+        help="simulation steps per second, independent of the frame rate",
+    )
+    parser.add_argument(
+        "--fps",
+        type=int,
+        default=RENDER_FPS_CAP,
+        help="frame rate cap, 0 for as fast as the display allows",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="time frame phases from the start (F3 shows them, F4 saves them)",
+    )
+    parser.add_argument(
+        "--quality",
+        choices=("auto", *LEVELS),
+        default="auto",
+        help="render quality; auto sheds detail while frames run over budget",
+    )
+    parser.add_argument(
+        "--render-scale",
+        type=_render_scale,
+        default=1.0,
+        help="world resolution as a fraction of the window, e.g. 0.75, or auto "
+        "to lower it while frames run over budget (default 1.0)",
+    )
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="print import, init and first-frame latency, and restart latency",
+    )
+    parser.add_argument(
+        "--cpu-report",
+        action="store_true",
+        help="print CPU usage of the pause and game over screens as they close",
+    )
+    args = parser.parse_args(argv)
+    if args.dirty_rects and args.render_scale != 1.0:
+        parser.error("--dirty-rects always renders at full resolution")
+    if args.profile:
+        profiler.enable()
+    frame_budget = 1 / (args.fps or RENDER_FPS_CAP)
+    if args.quality == "auto":
+        governor.enabled = True
+        governor.budget = frame_budget
+    else:
+        governor.set_level(LEVELS.index(args.quality))
+
+    if args.replay:
+        recording = Recording(args.replay)
+        _play(args, frame_budget, recording.seed, recording=recording)
+    elif args.record:
+        seed = random.randrange(2**32) if args.seed is None else args.seed
+        with Recorder(args.record, seed) as recorder:
+            _play(args, frame_budget, seed, recorder=recorder)
+    else:
+        _play(args, frame_budget, args.seed)
+
+
+def _play(
+    args: argparse.Namespace,
+    frame_budget: float,
+    seed: int | None,
+    recording: Recording | None = None,
+    recorder: Recorder | None = None,
+) -> None:
+    """Run games until the player quits, replaying or recording the first"""
+    # Only what the game uses; audio and joysticks stay down
+    pygame.display.init()
+    pygame.font.init()
     screen: pygame.Surface = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     clock: pygame.time.Clock = pygame.time.Clock()
     pygame.display.set_caption("Asteroids")
+    auto_scale = args.render_scale == "auto"
+    scaler = ResolutionScaler(screen, 1.0 if auto_scale else args.render_scale)
+    scaler.enabled = auto_scale
+    scaler.budget = frame_budget
+
+    hud = Hud()
+    startup.lap("init")
+    # Latency being measured until the next first frame, if any
+    startup_kind: str | None = "startup"
 
     # Reset starfield on new game
-    global _starfield_cache
-    _starfield_cache = None
+    global _starfield
+    _starfield = None
 
     while True:
-        game_objects = init_game()
-        updatable = game_objects["updatable"]
-        drawable = game_objects["drawable"]
-        asteroids = game_objects["asteroids"]
-        shots = game_objects["shots"]
-        powerups = game_objects["powerups"]
-        bombs = game_objects["bombs"]
-        explosions = game_objects["explosions"]
+        if recording is not None:
+            frames = iter(recording)
+        game_objects = init_game(seed=seed)
+        store = game_objects["store"]
+        particles = game_objects["particles"]
         player = game_objects["player"]
+        powerup_manager = game_objects["powerup_manager"]
 
-        powerup_manager = PowerUpManager()
-        score = 0
-        powerup_spawn_timer = 0.0
         game_over = False
         paused = False
-        font = pygame.font.Font(None, 48)
-        pause_font = pygame.font.Font(None, 72)
-
+        # Dirty-rect mode restores from the static starfield layer only
+        renderer = DirtyRectRenderer(get_starfield().base) if args.dirty_rects else None
+        background_offset = pygame.Vector2(0, 0)
+        timestep = FixedTimestep(args.tick_rate)
+        # Rewinding would desync the recorded input from the world
+        rewind = RewindBuffer() if recorder is None and recording is None else None
+        if rewind is not None:
+            rewind.record(game_objects)
+
+        startup.lap("new_game")
         dt: float = 0
         while not game_over:
+            frame_start = time.perf_counter()
+            profiler.start_frame()
             log_state()
+            profiler.lap("log_state")
 
+            pause_toggled = False
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
+                    if recorder is not None:
+                        recorder.close(world_digest(game_objects))
                     return
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
-                        paused = not paused
-
-            if not paused:
-                # Update power-up manager
-                powerup_manager.update(dt)
-                player.shield_active = powerup_manager.shield_active
-                player.speed_boost_active = powerup_manager.speed_boost_active
-                player.rapid_fire_active = powerup_manager.rapid_fire_active
-                player.triple_shot_active = powerup_manager.triple_shot_active
-
-                # Handle bomb dropping
-                keys = pygame.key.get_pressed()
-                if keys[pygame.K_b]:
-                    bomb_result = player.drop_bomb()
-                    if bomb_result:
-                        bomb_result.containers = (bombs, updatable, drawable)  # type: ignore
-                        bomb_result.add((bombs, updatable, drawable))  # type: ignore
-
-                updatable.update(dt)
-
-                # Spawn power-ups (only when not paused)
-                powerup_spawn_timer += dt
-                if powerup_spawn_timer > POWERUP_SPAWN_RATE_SECONDS and len(powerups) == 0:
-                    powerup_spawn_timer = 0
-                    x = random.randint(50, SCREEN_WIDTH - 50)
-                    y = random.randint(50, SCREEN_HEIGHT - 50)
-                    powerup = PowerUp(x, y)
-                    powerup.containers = (powerups, updatable, drawable)  # type: ignore
-                    powerup.add((powerups, updatable, drawable))  # type: ignore
-
-            # Check collisions: player vs asteroids
-            for asteroid in asteroids:
-                if player.shield_active:
-                    # Shield protects from one hit
-                    if asteroid.collides_with(player):
-                        log_event("player_hit_shield")
-                        asteroid.split()
-                        score += POINTS_PER_ASTEROID
-                        Explosion.create(
-                            asteroid.position.x,
-                            asteroid.position.y,
-                            (explosions, updatable, drawable),
-                        )
-                        powerup_manager.shield_active = False
-                        player.shield_active = False
+                        pause_toggled = not pause_toggled
+                    elif event.key == pygame.K_F3:
+                        profiler.toggle_overlay()
+                    elif event.key == pygame.K_F4 and profiler.enabled:
+                        print(f"Frame profile saved to {profiler.dump()}")
+
+            if pause_toggled:
+                paused = not paused
+            # Simulate in fixed steps; while paused no time accumulates
+            steps = 0 if paused else timestep.advance(dt)
+            controls = 0 if recording is not None else read_controls()
+            if rewind is not None and controls & REWIND and steps:
+                # Play time backwards at the speed it would have gone forward
+                rewind.step_back(game_objects, steps)
+                steps = 0
+            profiler.lap("input")
+
+            for _ in range(steps):
+                step_dt = timestep.step
+                if recording is not None:
+                    # Recorded input and step times replace the live ones
+                    frame = next(frames, None)
+                    if frame is None:
+                        matched = world_digest(game_objects) == recording.digest
+                        print(f"Replay finished, world state matches: {matched}")
+                        return
+                    controls, step_dt = frame
+                elif recorder is not None:
+                    # Rewind is off while recording; keep its key out of the file
+                    controls &= ~REWIND
+                    step_dt = recorder.record(controls, step_dt)
+
+                update_game(game_objects, step_dt, controls)
+                # The ship's actual movement; velocity lingers after it stops
+                background_offset += player.table.moved(player.slot)
+                profiler.lap("update")
+                game_over = check_collisions(game_objects)
+                if rewind is not None:
+                    rewind.record(game_objects)
+                profiler.lap("snapshot")
+                if game_over:
+                    break
+
+            # Draw everything, interpolated between the last two sim steps
+            with store.interpolated(timestep.alpha):
+                # The world may go to a smaller surface; the HUD always
+                # goes to the screen at full resolution
+                world = scaler.surface
+                if renderer is None:
+                    draw_background(world, background_offset)
+                else:
+                    # Follow the quality governor dropping the starfield
+                    base = get_starfield().base if governor.draw_starfield else None
+                    renderer.set_background(base)
+                    renderer.clear(screen)
+                profiler.lap("background")
+
+                draw_world(world, game_objects, scaler.scale)
+                profiler.lap("draw")
+                scaler.present()
+                profiler.lap("upscale")
+
+                # Draw score (top left, always on top)
+                hud_rects = [hud.draw_score(screen, game_objects["score"])]
+
+                # Draw pause screen
+                if paused:
+                    hud_rects.append(hud.draw_pause(screen))
+
+                # Draw power-up status
+                hud_rects += hud.draw_powerups(screen, powerup_manager)
+
+                # Draw frame profile (toggled with F3)
+                if profiler.show_overlay:
+                    counts = {name: len(game_objects[name]) for name in _OVERLAY_GROUPS}
+                    counts["quality"] = governor.level
+                    counts["scale%"] = round(scaler.scale * 100)
+                    if rewind is not None:
+                        counts["rewind_kb"] = rewind.bytes // 1024
+                    hud_rects.append(profiler.draw_overlay(screen, counts))
+                profiler.lap("hud")
+
+                if renderer is None:
+                    pygame.display.flip()
                 else:
-                    # Use triangular hitbox
-                    if player.collides_with_triangle(asteroid):
-                        log_event("player_hit")
-                        game_over = True
-                        break
-
-            # Check collisions: shots vs asteroids
-            for asteroid in list(asteroids):
-                for shot in list(shots):
-                    if shot.collides_with(asteroid):
-                        log_event("asteroid_shot")
-                        shot.kill()
-                        asteroid.split()
-                        score += POINTS_PER_ASTEROID
-                        Explosion.create(
-                            asteroid.position.x,
-                            asteroid.position.y,
-                            (explosions, updatable, drawable),
-                        )
-                        break
-
-            # Check collisions: bombs vs asteroids
-            for bomb in list(bombs):
-                if bomb.exploded:
-                    # Bomb exploded, destroy nearby asteroids
-                    for asteroid in list(asteroids):
-                        if bomb.position.distance_to(asteroid.position) <= BOMB_RADIUS:
-                            log_event("asteroid_destroyed_by_bomb")
-                            asteroid.split()
-                            score += POINTS_PER_ASTEROID
-                            Explosion.create(
-                                asteroid.position.x,
-                                asteroid.position.y,
-                                (explosions, updatable, drawable),
-                            )
-                    Explosion.create(
-                        bomb.position.x,
-                        bomb.position.y,
-                        (explosions, updatable, drawable),
-                    )
-                    bomb.kill()
-
-            # Check collisions: player vs power-ups
-            for powerup in list(powerups):
-                if powerup.collides_with(player):
-                    log_event("powerup_collected", type=powerup.powerup_type)
-                    powerup_manager.activate(powerup.powerup_type)
-                    powerup.kill()
-
-            # Draw everything
-            draw_background(screen)
-
-            for obj in drawable:
-                obj.draw(screen)
-
-            # Draw score (top left, always on top)
-            score_text = font.render(f"Score: {score}", True, (255, 255, 255))
-            screen.blit(score_text, (10, 10))
-
-            # Draw pause screen
+                    renderer.present(itertools.chain([particles], store), hud_rects)
+                profiler.lap("present")
+            if startup_kind is not None:
+                startup.lap("first_frame")
+                _report_startup(startup_kind, args.startup_report)
+                startup_kind = None
+            frame_time = time.perf_counter() - frame_start
+            governor.record(frame_time)
+            scaler.record(frame_time)
+
+            # Caps the frame rate; the simulation rate is fixed separately
+            dt = clock.tick(args.fps) / 1000
+            profiler.lap("wait")
+
             if paused:
-                pause_text = pause_font.render("PAUSED", True, (255, 255, 255))
-                pause_rect = pause_text.get_rect(
-                    center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
-                )
-                # Draw semi-transparent overlay
-                overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-                overlay.set_alpha(128)
-                overlay.fill((0, 0, 0))
-                screen.blit(overlay, (0, 0))
-                screen.blit(pause_text, pause_rect)
-
-            # Draw power-up status
-            y_offset = 60
-            if powerup_manager.shield_active:
-                shield_text = font.render(
-                    f"Shield: {powerup_manager.shield_timer:.1f}s", True, (0, 150, 255)
-                )
-                screen.blit(shield_text, (10, y_offset))
-                y_offset += 40
-            if powerup_manager.speed_boost_active:
-                speed_text = font.render(
-                    f"Speed Boost: {powerup_manager.speed_boost_timer:.1f}s",
-                    True,
-                    (255, 200, 0),
-                )
-                screen.blit(speed_text, (10, y_offset))
-                y_offset += 40
-            if powerup_manager.rapid_fire_active:
-                rapid_text = font.render(
-                    f"Rapid Fire: {powerup_manager.rapid_fire_timer:.1f}s",
-                    True,
-                    (255, 0, 0),
-                )
-                screen.blit(rapid_text, (10, y_offset))
-                y_offset += 40
-            if powerup_manager.triple_shot_active:
-                triple_text = font.render(
-                    f"Triple Shot: {powerup_manager.triple_shot_timer:.1f}s",
-                    True,
-                    (0, 255, 0),
-                )
-                screen.blit(triple_text, (10, y_offset))
-
-            pygame.display.flip()
-
-            # limits game to 60 fps
-            dt = clock.tick(60) / 1000
+                # Nothing moves while paused: keep the paused frame up and
+                # sleep until ESC rather than drawing it again every frame
+                with cpu_meter.measure("pause") as usage:
+                    key = wait_for_key(screen, (pygame.K_ESCAPE,))
+                _report_cpu("pause", usage, args.cpu_report)
+                if key is None:
+                    if recorder is not None:
+                        recorder.close(world_digest(game_objects))
+                    return
+                paused = False
+                # The time spent paused never reaches the simulation
+                clock.tick()
+                dt = 0
+
+        if recorder is not None:
+            # Only the first game is recorded
+            recorder.close(world_digest(game_objects))
+            recorder = None
+            seed = args.seed
+        if recording is not None:
+            matched = world_digest(game_objects) == recording.digest
+            print(f"Replay finished, world state matches: {matched}")
 
         # Game over - show screen and check for restart
-        if not show_game_over_screen(screen, score):
+        with cpu_meter.measure("game_over") as usage:
+            restart = show_game_over_screen(screen, game_objects["score"])
+        _report_cpu("game_over", usage, args.cpu_report)
+        if not restart:
             return
-
+        # Like pausing, the game over screen's time never reaches the
+        # simulation of the next game
+        clock.tick()
+        startup.restart()
+        startup_kind = "restart"
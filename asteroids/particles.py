@@ -0,0 +1,80 @@
+import numpy as np
+import pygame
+
+from asteroids.constants import (
+    EXPLOSION_DURATION,
+    PARTICLE_CAPACITY,
+    PARTICLE_FRICTION,
+    PARTICLE_RADIUS,
+)
+
+
+class ParticleSystem:
+    """Fixed-capacity ring buffer of explosion particles.
+
+    Particles live in preallocated arrays and are updated, culled and drawn
+    in bulk. Once the buffer is full new particles overwrite the oldest
+    ones, so explosion storms have a bounded per-frame cost.
+    """
+
+    def __init__(self, capacity: int = PARTICLE_CAPACITY) -> None:
+        self.capacity: int = capacity
+        self.positions: np.ndarray = np.zeros((capacity, 2))
+        self.velocities: np.ndarray = np.zeros((capacity, 2))
+        self.lifetimes: np.ndarray = np.zeros(capacity)
+        self.head: int = 0
+        self.live: int = 0
+        self.evicted: int = 0
+        self.rng: np.random.Generator = np.random.default_rng()
+
+    def __len__(self) -> int:
+        return self.live
+
+    def emit(self, x: float, y: float, count: int) -> None:
+        count = min(count, self.capacity)
+        slots = (self.head + np.arange(count)) % self.capacity
+        evicted = int(np.count_nonzero(self.lifetimes[slots] > 0))
+        self.evicted += evicted
+
+        angles = np.radians(self.rng.uniform(0, 360, count))
+        speeds = self.rng.uniform(50, 150, count)
+        self.positions[slots] = (x, y)
+        # Same direction as pygame.Vector2(0, 1).rotate(angle)
+        self.velocities[slots, 0] = -np.sin(angles) * speeds
+        self.velocities[slots, 1] = np.cos(angles) * speeds
+        self.lifetimes[slots] = EXPLOSION_DURATION
+
+        self.head = (self.head + count) % self.capacity
+        self.live += count - evicted
+
+    def update(self, dt: float) -> None:
+        if self.live == 0:
+            return
+        self.positions += self.velocities * dt
+        self.velocities *= PARTICLE_FRICTION
+        self.lifetimes -= dt
+        self.live = int(np.count_nonzero(self.lifetimes > 0))
+
+    def bounds(self) -> pygame.Rect | None:
+        """Area covering every live particle, used for dirty-rect rendering"""
+        if self.live == 0:
+            return None
+        positions = self.positions[self.lifetimes > 0]
+        left, top = (positions.min(axis=0) - PARTICLE_RADIUS - 1).tolist()
+        right, bottom = (positions.max(axis=0) + PARTICLE_RADIUS + 2).tolist()
+        return pygame.Rect(int(left), int(top), int(right - left), int(bottom - top))
+
+    def draw(self, screen: pygame.Surface, scale: float = 1.0) -> None:
+        if self.live == 0:
+            return
+        alive = np.flatnonzero(self.lifetimes > 0)
+        fraction = self.lifetimes[alive] / EXPLOSION_DURATION
+        sizes = (PARTICLE_RADIUS * scale * fraction).astype(int)
+        greens = np.minimum(255, (255 * fraction).astype(int) + 100)
+        visible = sizes > 0
+        for (x, y), size, green in zip(
+            (self.positions[alive[visible]] * scale).tolist(),
+            sizes[visible].tolist(),
+            greens[visible].tolist(),
+        ):
+            pygame.draw.circle(screen, (255, green, 0), (x, y), size)
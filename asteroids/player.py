@@ -1,12 +1,13 @@
+from functools import partial
 from typing import Optional
 
 import pygame
 
+from asteroids.atlas import sprite_atlas
 from asteroids.bomb import Bomb
 from asteroids.circleshape import CircleShape
 from asteroids.constants import (
     BOMB_COOLDOWN,
-    LINE_WIDTH,
     PLAYER_ACCELERATION,
     PLAYER_FRICTION,
     PLAYER_MAX_SPEED,
@@ -14,16 +15,56 @@ from asteroids.constants import (
     PLAYER_SHOOT_COOLDOWN_SECONDS,
     PLAYER_SHOOT_SPEED,
     PLAYER_TURN_SPEED,
-    SCREEN_HEIGHT,
-    SCREEN_WIDTH,
     SPEED_BOOST_MULTIPLIER,
 )
+from asteroids.controls import SHOOT, THRUST, TURN_LEFT, TURN_RIGHT
+from asteroids.entities import EntityStore
+from asteroids.shapes import line_width
 from asteroids.shot import Shot
 
 
+def _ship_points(
+    center: pygame.Vector2, rotation: float, radius: float
+) -> list[pygame.Vector2]:
+    forward: pygame.Vector2 = pygame.Vector2(0, 1).rotate(rotation)
+    right: pygame.Vector2 = pygame.Vector2(0, 1).rotate(rotation + 90) * radius / 1.5
+    a: pygame.Vector2 = center + forward * radius
+    b: pygame.Vector2 = center - forward * radius - right
+    c: pygame.Vector2 = center - forward * radius + right
+    return [a, b, c]
+
+
+def _paint_ship(
+    surface: pygame.Surface, center: float, angle: float, scale: float, shielded: bool
+) -> None:
+    radius = PLAYER_RADIUS * scale
+    points = _ship_points(pygame.Vector2(center, center), angle, radius)
+    color = "cyan" if shielded else "white"
+    pygame.draw.polygon(surface, color, points, line_width(scale))  # type: ignore
+    if shielded:
+        # Draw shield effect
+        pygame.draw.circle(
+            surface,
+            (0, 150, 255, 100),
+            (center, center),
+            radius + 5 * scale,
+            line_width(scale),
+        )
+
+
+# Rear corners of the triangle, or the shield ring
+_SHIP_EXTENT: float = max(PLAYER_RADIUS * 1.2, PLAYER_RADIUS + 5)
+sprite_atlas.register("player", partial(_paint_ship, shielded=False), _SHIP_EXTENT)
+sprite_atlas.register(
+    "player_shielded", partial(_paint_ship, shielded=True), _SHIP_EXTENT
+)
+
+
 class Player(CircleShape):
-    def __init__(self, x: float, y: float) -> None:
-        super().__init__(x, y, PLAYER_RADIUS)
+    integrate = False  # Only moves while thrusting, see move()
+
+    def __init__(self, store: EntityStore, x: float, y: float) -> None:
+        super().__init__(store, x, y, PLAYER_RADIUS)
         self.rotation: float = 0
         self.shoot_timer: float = 0
         self.bomb_timer: float = 0
@@ -31,25 +72,17 @@ class Player(CircleShape):
         self.triple_shot_active: bool = False
         self.speed_boost_active: bool = False
         self.shield_active: bool = False
+        self.controls: int = 0  # Control mask for this frame, see controls.py
 
     def triangle(self) -> list[pygame.Vector2]:
-        forward: pygame.Vector2 = pygame.Vector2(0, 1).rotate(self.rotation)
-        right: pygame.Vector2 = (
-            pygame.Vector2(0, 1).rotate(self.rotation + 90) * self.radius / 1.5
-        )
-        a: pygame.Vector2 = self.position + forward * self.radius
-        b: pygame.Vector2 = self.position - forward * self.radius - right
-        c: pygame.Vector2 = self.position - forward * self.radius + right
-        return [a, b, c]
-
-    def draw(self, screen: pygame.Surface) -> None:
-        color = "cyan" if self.shield_active else "white"
-        pygame.draw.polygon(screen, color, self.triangle(), LINE_WIDTH)  # type: ignore
-        if self.shield_active:
-            # Draw shield effect
-            pygame.draw.circle(
-                screen, (0, 150, 255, 100), self.position, self.radius + 5, 2
-            )
+        return _ship_points(self.position, self.rotation, self.radius)
+
+    def draw(self, screen: pygame.Surface, scale: float = 1.0) -> None:
+        sprite = "player_shielded" if self.shield_active else "player"
+        sprite_atlas.blit(screen, sprite, self.position, self.rotation, scale)
+
+    def draw_extent(self) -> float:
+        return _SHIP_EXTENT
 
     def rotate(self, dt: float) -> None:
         self.rotation += PLAYER_TURN_SPEED * dt
@@ -68,15 +101,6 @@ class Player(CircleShape):
             self.velocity = self.velocity.normalize() * max_speed
         self.velocity *= PLAYER_FRICTION
         self.position += self.velocity * dt
-        # Wrap around screen
-        if self.position.x < 0:
-            self.position.x = SCREEN_WIDTH
-        elif self.position.x > SCREEN_WIDTH:
-            self.position.x = 0
-        if self.position.y < 0:
-            self.position.y = SCREEN_HEIGHT
-        elif self.position.y > SCREEN_HEIGHT:
-            self.position.y = 0
 
     def shoot(self):
         cooldown = PLAYER_SHOOT_COOLDOWN_SECONDS
@@ -92,14 +116,14 @@ class Player(CircleShape):
         if self.triple_shot_active:
             # Shoot three shots in a spread
             for angle_offset in [-15, 0, 15]:
-                shot = Shot(self.position.x, self.position.y)
+                shot = self.store.spawn(Shot, self.position.x, self.position.y)
                 shot.velocity = (
                     pygame.Vector2(0, 1).rotate(self.rotation + angle_offset)
                     * PLAYER_SHOOT_SPEED
                 )
         else:
             # Single shot
-            shot = Shot(self.position.x, self.position.y)
+            shot = self.store.spawn(Shot, self.position.x, self.position.y)
             shot.velocity = (
                 pygame.Vector2(0, 1).rotate(self.rotation) * PLAYER_SHOOT_SPEED
             )
@@ -108,7 +132,7 @@ class Player(CircleShape):
         if self.bomb_timer > 0:
             return None
         self.bomb_timer = BOMB_COOLDOWN
-        bomb = Bomb(self.position.x, self.position.y)
+        bomb = self.store.spawn(Bomb, self.position.x, self.position.y)
         return bomb
 
     def collides_with_triangle(self, other) -> bool:
@@ -126,13 +150,12 @@ class Player(CircleShape):
     def update(self, dt: float) -> None:
         self.shoot_timer -= dt
         self.bomb_timer -= dt
-        keys: tuple[int, ...] = pygame.key.get_pressed()
 
-        if keys[pygame.K_w]:
+        if self.controls & THRUST:
             self.move(dt)
-        if keys[pygame.K_a]:
+        if self.controls & TURN_LEFT:
             self.rotate(-dt)
-        if keys[pygame.K_d]:
+        if self.controls & TURN_RIGHT:
             self.rotate(dt)
-        if keys[pygame.K_SPACE]:
+        if self.controls & SHOOT:
             self.shoot()
@@ -1,55 +1,76 @@
 import random
+from functools import partial
 
 import pygame
 
+from asteroids.atlas import sprite_atlas
 from asteroids.circleshape import CircleShape
-from asteroids.constants import (
-    LINE_WIDTH,
-    POWERUP_DURATION,
-    SCREEN_HEIGHT,
-    SCREEN_WIDTH,
-    SHIELD_DURATION,
-)
+from asteroids.constants import POWERUP_DURATION, POWERUP_RADIUS, SHIELD_DURATION
+from asteroids.entities import EntityStore
+from asteroids.shapes import line_width
+
+# Color based on type
+POWERUP_COLORS: dict[str, tuple[int, int, int]] = {
+    "shield": (0, 150, 255),  # Blue
+    "speed": (255, 200, 0),  # Yellow
+    "rapid_fire": (255, 0, 0),  # Red
+    "triple_shot": (0, 255, 0),  # Green
+}
+
+
+def _paint_diamond(
+    surface: pygame.Surface,
+    center: float,
+    angle: float,
+    scale: float,
+    color: tuple[int, int, int],
+) -> None:
+    # Draw power-up as a rotating diamond/square
+    offset = pygame.Vector2(0, POWERUP_RADIUS * scale)
+    points = [
+        pygame.Vector2(center, center) + offset.rotate(angle + i * 90) for i in range(4)
+    ]
+    pygame.draw.polygon(surface, color, points, line_width(scale))
+
+
+def _register_sprites() -> None:
+    # A square looks the same every quarter turn
+    for powerup_type, color in POWERUP_COLORS.items():
+        sprite_atlas.register(
+            f"powerup_{powerup_type}",
+            partial(_paint_diamond, color=color),
+            POWERUP_RADIUS,
+            period=90.0,
+        )
+
+
+_register_sprites()
 
 
 class PowerUp(CircleShape):
-    POWERUP_TYPES = ["shield", "speed", "rapid_fire", "triple_shot"]
+    POWERUP_TYPES = list(POWERUP_COLORS)
 
-    def __init__(self, x: float, y: float) -> None:
-        super().__init__(x, y, 15)
+    def __init__(self, store: EntityStore, x: float, y: float) -> None:
+        super().__init__(store, x, y, POWERUP_RADIUS)
         self.powerup_type = random.choice(self.POWERUP_TYPES)
         self.rotation = 0.0
         self.rotation_speed = 90.0
 
-    def draw(self, screen: pygame.Surface) -> None:
-        # Draw power-up as a rotating diamond/square
-        points = []
-        for i in range(4):
-            angle = self.rotation + i * 90
-            point = self.position + pygame.Vector2(0, self.radius).rotate(angle)
-            points.append(point)
-
-        # Color based on type
-        colors = {
-            "shield": (0, 150, 255),  # Blue
-            "speed": (255, 200, 0),  # Yellow
-            "rapid_fire": (255, 0, 0),  # Red
-            "triple_shot": (0, 255, 0),  # Green
-        }
-        color = colors.get(self.powerup_type, "white")
-        pygame.draw.polygon(screen, color, points, LINE_WIDTH)
+    @property
+    def type_index(self) -> int:
+        """powerup_type as an index into POWERUP_TYPES"""
+        return self.POWERUP_TYPES.index(self.powerup_type)
+
+    @type_index.setter
+    def type_index(self, index: int) -> None:
+        self.powerup_type = self.POWERUP_TYPES[index]
+
+    def draw(self, screen: pygame.Surface, scale: float = 1.0) -> None:
+        sprite = f"powerup_{self.powerup_type}"
+        sprite_atlas.blit(screen, sprite, self.position, self.rotation, scale)
 
     def update(self, dt: float) -> None:
         self.rotation += self.rotation_speed * dt
-        # Wrap around screen
-        if self.position.x < 0:
-            self.position.x = SCREEN_WIDTH
-        elif self.position.x > SCREEN_WIDTH:
-            self.position.x = 0
-        if self.position.y < 0:
-            self.position.y = SCREEN_HEIGHT
-        elif self.position.y > SCREEN_HEIGHT:
-            self.position.y = 0
 
 
 class PowerUpManager:
@@ -0,0 +1,154 @@
+import csv
+import os
+import time
+
+import numpy as np
+import pygame
+
+from asteroids.constants import PROFILER_FRAMES, PROFILER_OVERLAY_REFRESH_FRAMES
+from asteroids.fonts import get_font
+
+PHASES: tuple[str, ...] = (
+    "log_state",
+    "input",
+    "update",
+    "broadphase",
+    "collide_player",
+    "collide_shots",
+    "collide_bombs",
+    "collide_powerups",
+    "snapshot",
+    "background",
+    "draw",
+    "upscale",
+    "hud",
+    "present",
+    "wait",
+)
+
+
+class FrameProfiler:
+    """Per-phase frame timings kept in a fixed-size ring buffer.
+
+    Call `start_frame()` at the top of the frame and `lap(phase)` after each
+    phase; the time since the previous lap is added to that phase, so a
+    phase that runs several times per frame (e.g. one update per sim step)
+    is summed. While disabled every call returns immediately.
+    """
+
+    def __init__(self, capacity: int = PROFILER_FRAMES) -> None:
+        self.enabled: bool = False
+        self.capacity: int = capacity
+        self.columns: dict[str, int] = {phase: i for i, phase in enumerate(PHASES)}
+        self.samples: np.ndarray = np.zeros((capacity, len(PHASES)), dtype=np.int64)
+        self.frames: int = 0
+        self.row: list[int] = [0] * len(PHASES)
+        self.last: int = 0
+
+        self.show_overlay: bool = False
+        self.font: pygame.font.Font | None = None
+        self.overlay: pygame.Surface | None = None
+
+    def enable(self) -> None:
+        if not self.enabled:
+            self.enabled = True
+            self.last = 0  # Don't store a partial frame
+
+    def toggle_overlay(self) -> None:
+        """Show or hide the overlay; showing it starts profiling"""
+        self.show_overlay = not self.show_overlay
+        self.overlay = None
+        if self.show_overlay:
+            self.enable()
+
+    def start_frame(self) -> None:
+        if not self.enabled:
+            return
+        if self.last:
+            # Store the frame that just finished
+            self.samples[self.frames % self.capacity] = self.row
+            self.frames += 1
+        self.row = [0] * len(PHASES)
+        self.last = time.perf_counter_ns()
+
+    def lap(self, phase: str) -> None:
+        if not self.enabled or not self.last:
+            return
+        now = time.perf_counter_ns()
+        self.row[self.columns[phase]] += now - self.last
+        self.last = now
+
+    def recent(self) -> np.ndarray:
+        """Timings of the buffered frames in nanoseconds, oldest first"""
+        if self.frames < self.capacity:
+            return self.samples[: self.frames]
+        head = self.frames % self.capacity
+        return np.roll(self.samples, -head, axis=0)
+
+    def summary(self) -> dict[str, tuple[float, float, float]]:
+        """Rolling mean, p95 and p99 per phase in milliseconds"""
+        samples = self.recent()
+        if len(samples) == 0:
+            return {}
+        ms = samples / 1e6
+        mean = ms.mean(axis=0)
+        p95, p99 = np.percentile(ms, (95, 99), axis=0)
+        return {
+            phase: (float(mean[i]), float(p95[i]), float(p99[i]))
+            for i, phase in enumerate(PHASES)
+        }
+
+    def dump(self, path: str | None = None) -> str:
+        """Write the buffered frames to a CSV file and return its path"""
+        if path is None:
+            path = time.strftime("logs/profile_%Y%m%d_%H%M%S.csv")
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        samples = self.recent()
+        first = self.frames - len(samples)
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", *(f"{phase}_us" for phase in PHASES)])
+            for i, row in enumerate(samples):
+                writer.writerow([first + i, *(round(ns / 1000, 1) for ns in row)])
+        return path
+
+    def _render_overlay(self, counts: dict[str, int]) -> pygame.Surface:
+        if self.font is None:
+            self.font = get_font(20)
+        rows: list[list[str]] = [["phase (ms)", "mean", "p95", "p99"]]
+        frame_mean = 0.0
+        for phase, stats in self.summary().items():
+            rows.append([phase, *(f"{value:.2f}" for value in stats)])
+            frame_mean += stats[0]
+        rows.append(["frame", f"{frame_mean:.2f}"])
+        footer = " ".join(f"{name}={count}" for name, count in counts.items())
+
+        # Phase names left-aligned, numbers right-aligned in fixed columns
+        color = (255, 255, 0)
+        height = self.font.get_linesize()
+        name_width, number_width = 130, 50
+        width = max(name_width + 3 * number_width, self.font.size(footer)[0]) + 10
+        overlay = pygame.Surface((width, height * (len(rows) + 1) + 10))
+        overlay.set_alpha(200)
+        for i, row in enumerate(rows):
+            y = 5 + height * i
+            overlay.blit(self.font.render(row[0], True, color), (5, y))
+            for j, cell in enumerate(row[1:], 1):
+                text = self.font.render(cell, True, color)
+                right = 5 + name_width + number_width * j
+                overlay.blit(text, text.get_rect(topright=(right, y)))
+        overlay.blit(self.font.render(footer, True, color), (5, 5 + height * len(rows)))
+        return overlay
+
+    def draw_overlay(
+        self, screen: pygame.Surface, counts: dict[str, int]
+    ) -> pygame.Rect:
+        """Draw phase timings and entity counts in the top right corner"""
+        # Text is re-rendered a few times per second, not every frame
+        if self.overlay is None or self.frames % PROFILER_OVERLAY_REFRESH_FRAMES == 0:
+            self.overlay = self._render_overlay(counts)
+        rect = self.overlay.get_rect(topright=(screen.get_width() - 10, 10))
+        return screen.blit(self.overlay, rect)
+
+
+profiler: FrameProfiler = FrameProfiler()
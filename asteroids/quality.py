@@ -0,0 +1,115 @@
+from collections import deque
+
+from asteroids.constants import (
+    QUALITY_DEGRADE_RATIO,
+    QUALITY_LOG_THROTTLE,
+    QUALITY_PARTICLE_FRACTION,
+    QUALITY_RESTORE_RATIO,
+    QUALITY_WINDOW_FRAMES,
+    RENDER_FPS_CAP,
+)
+from asteroids.logger import configure_state_log, log_event
+
+# Each level keeps the savings of the levels before it
+LEVELS: tuple[str, ...] = (
+    "full",
+    "fewer_particles",
+    "simple_outlines",
+    "no_starfield",
+    "throttled_logging",
+)
+
+
+class BudgetGovernor:
+    """Steps through levels of detail while frames run over or under budget.
+
+    Frame work time (everything but the frame cap wait) is averaged over a
+    rolling window. Above `degrade_ratio` of the budget the level goes one
+    step down, below `restore_ratio` one step back up. The window is
+    emptied after every change, so the next decision only looks at frames
+    rendered at the new level. While disabled the level stays where it is.
+    """
+
+    levels: tuple = ()
+
+    def __init__(
+        self,
+        budget: float = 1 / RENDER_FPS_CAP,
+        window: int = QUALITY_WINDOW_FRAMES,
+        degrade_ratio: float = QUALITY_DEGRADE_RATIO,
+        restore_ratio: float = QUALITY_RESTORE_RATIO,
+    ) -> None:
+        self.enabled: bool = False
+        self.budget: float = budget
+        self.degrade_ratio: float = degrade_ratio
+        self.restore_ratio: float = restore_ratio
+        self.samples: deque[float] = deque(maxlen=window)
+        self.level: int = 0
+        self.changes: int = 0
+
+    @property
+    def average(self) -> float:
+        """Rolling average frame work time in seconds"""
+        return sum(self.samples) / len(self.samples) if self.samples else 0.0
+
+    def set_level(self, level: int) -> None:
+        level = min(max(level, 0), len(self.levels) - 1)
+        if level == self.level:
+            return
+        previous = self.level
+        self.level = level
+        self.changes += 1
+        self.apply(previous)
+        self.samples.clear()
+
+    def apply(self, previous: int) -> None:
+        """Put the new level into effect; `average` still covers the old one"""
+
+    def record(self, frame_time: float) -> None:
+        """Add one frame's work time and adjust the level if needed"""
+        if not self.enabled:
+            return
+        self.samples.append(frame_time)
+        if len(self.samples) < (self.samples.maxlen or 0):
+            return
+        average = self.average
+        if average > self.budget * self.degrade_ratio:
+            self.set_level(self.level + 1)
+        elif average < self.budget * self.restore_ratio:
+            self.set_level(self.level - 1)
+
+
+class QualityGovernor(BudgetGovernor):
+    """Sheds rendering work in steps while frames run over budget"""
+
+    levels: tuple[str, ...] = LEVELS
+
+    @property
+    def name(self) -> str:
+        return LEVELS[self.level]
+
+    @property
+    def particle_fraction(self) -> float:
+        """Share of EXPLOSION_PARTICLES to emit per explosion"""
+        return QUALITY_PARTICLE_FRACTION if self.level >= 1 else 1.0
+
+    @property
+    def simple_outlines(self) -> bool:
+        return self.level >= 2
+
+    @property
+    def draw_starfield(self) -> bool:
+        return self.level < 3
+
+    def apply(self, previous: int) -> None:
+        log_event(
+            "quality_changed",
+            level=self.level,
+            quality=self.name,
+            previous=LEVELS[previous],
+            frame_ms=round(self.average * 1000, 2),
+        )
+        configure_state_log(throttle=QUALITY_LOG_THROTTLE if self.level >= 4 else 1)
+
+
+governor: QualityGovernor = QualityGovernor()
@@ -0,0 +1,88 @@
+import itertools
+from collections.abc import Iterable
+
+import pygame
+
+from asteroids.constants import DIRTY_RECT_MAX_AREA, SCREEN_HEIGHT, SCREEN_WIDTH
+from asteroids.starfield import BACKGROUND_COLOR
+
+
+class DirtyRectRenderer:
+    """Repaints and presents only the screen regions that changed.
+
+    Each frame the regions drawn in the previous frame are restored from
+    the cached background, or filled with BACKGROUND_COLOR without one, and
+    only those plus the newly drawn regions are pushed with
+    pygame.display.update(). If the dirty area exceeds `max_dirty_fraction`
+    of the screen it falls back to a full flip.
+    """
+
+    def __init__(
+        self,
+        background: pygame.Surface | None,
+        max_dirty_fraction: float = DIRTY_RECT_MAX_AREA,
+    ) -> None:
+        self.background: pygame.Surface | None = background
+        self.screen_rect: pygame.Rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.max_dirty_area: float = max_dirty_fraction * SCREEN_WIDTH * SCREEN_HEIGHT
+        # Rects drawn last frame, keyed by sprite (or HUD slot)
+        self.previous: dict[object, pygame.Rect] = {}
+        self.full_redraw: bool = True
+        self.full_frames: int = 0
+        self.partial_frames: int = 0
+
+    def invalidate(self) -> None:
+        """Force the next frame to repaint and present the whole screen"""
+        self.full_redraw = True
+
+    def set_background(self, background: pygame.Surface | None) -> None:
+        """Restore from `background` from now on, repainting all of it once"""
+        if background is not self.background:
+            self.background = background
+            self.invalidate()
+
+    def clear(self, screen: pygame.Surface) -> None:
+        """Restore the areas drawn last frame from the background"""
+        rects = [self.screen_rect] if self.full_redraw else self.previous.values()
+        for rect in rects:
+            if self.background is None:
+                screen.fill(BACKGROUND_COLOR, rect)
+            else:
+                screen.blit(self.background, rect, rect)
+
+    def present(
+        self, drawable: Iterable, extra_rects: Iterable[pygame.Rect] = ()
+    ) -> None:
+        """Push this frame's changes to the display"""
+        current: dict[object, pygame.Rect] = {}
+        regions = [(sprite, sprite.bounds()) for sprite in drawable]
+        for key, rect in itertools.chain(regions, enumerate(extra_rects)):
+            # Nothing drawn; an empty Rect would union as the point (0, 0)
+            if rect is not None and rect.width and rect.height:
+                current[key] = rect
+
+        # Merge each region's old and new rect so overlap isn't counted twice
+        dirty: list[pygame.Rect] = []
+        for key, rect in current.items():
+            rect = rect.clip(self.screen_rect)
+            previous = self.previous.pop(key, None)
+            if previous is not None:
+                rect = rect.union(previous) if rect.width and rect.height else previous
+            if rect.width and rect.height:
+                dirty.append(rect)
+        dirty.extend(self.previous.values())
+
+        area = sum(rect.width * rect.height for rect in dirty)
+        if self.full_redraw or area > self.max_dirty_area:
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            pygame.display.update(dirty)
+            self.partial_frames += 1
+
+        self.full_redraw = False
+        self.previous = {
+            key: clipped
+            for key, rect in current.items()
+            if (clipped := rect.clip(self.screen_rect)).width and clipped.height
+        }
@@ -0,0 +1,139 @@
+"""Compact binary input recordings for deterministic replays.
+
+A recording is a header with the RNG seed, one `(controls, dt)` record per
+frame and, once the session ends, a digest of the final world state:
+
+    header  "<8sQ"   magic, seed
+    frame   "<Bf"    control mask (see controls.py), dt as float32
+    end     "<B32s"  0xFF marker, SHA-256 of the final world state
+"""
+
+import hashlib
+import random
+import struct
+from collections.abc import Iterator
+from typing import Any, BinaryIO, Self
+
+import pygame
+
+_MAGIC: bytes = b"ASTREC03"
+_HEADER: struct.Struct = struct.Struct("<8sQ")
+_FRAME: struct.Struct = struct.Struct("<Bf")
+_END: struct.Struct = struct.Struct("<B32s")
+_END_MARKER: int = 0xFF  # Never a valid control mask
+
+
+class Recorder:
+    """Append per-frame input to a recording file
+
+    The file is open inside a `with` block, so it is closed even when the
+    game stops with an error; a recording left without a digest still
+    replays up to its last whole frame.
+    """
+
+    def __init__(self, path: str, seed: int) -> None:
+        self.path: str = path
+        self.seed: int = seed
+        self.file: BinaryIO | None = None
+        self.frames: int = 0
+
+    def __enter__(self) -> Self:
+        self.file = open(self.path, "wb")
+        self.file.write(_HEADER.pack(_MAGIC, self.seed))
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def record(self, controls: int, dt: float) -> float:
+        """Store one frame and return dt as stored; simulate with that value"""
+        data = _FRAME.pack(controls, dt)
+        self.file.write(data)
+        self.frames += 1
+        return _FRAME.unpack(data)[1]
+
+    def close(self, digest: bytes | None = None) -> None:
+        """Finish the recording, optionally sealing it with a world digest"""
+        if self.file is None or self.file.closed:
+            return
+        if digest is not None:
+            self.file.write(_END.pack(_END_MARKER, digest))
+        self.file.close()
+
+
+class Recording:
+    """A recording loaded into memory"""
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < _HEADER.size:
+            raise ValueError(f"{path}: not an asteroids recording")
+        magic, self.seed = _HEADER.unpack_from(data)
+        if magic[:6] == _MAGIC[:6] and magic != _MAGIC:
+            # Older versions updated entities in a different order
+            raise ValueError(f"{path}: recorded by an incompatible game version")
+        if magic != _MAGIC:
+            raise ValueError(f"{path}: not an asteroids recording")
+
+        body = memoryview(data)[_HEADER.size :]
+        end = len(body) - _END.size
+        self.digest: bytes | None = None
+        if end >= 0 and end % _FRAME.size == 0 and body[end] == _END_MARKER:
+            self.digest = _END.unpack_from(body, end)[1]
+        else:
+            # Unfinished recording, e.g. the game crashed: keep whole frames
+            end = len(body) - len(body) % _FRAME.size
+        self.frames: list[tuple[int, float]] = list(_FRAME.iter_unpack(body[:end]))
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def __iter__(self) -> Iterator[tuple[int, float]]:
+        return iter(self.frames)
+
+
+def _pack_sprites(digest: Any, sprites: Any, *fields: str) -> None:
+    for sprite in sprites:
+        for field in fields:
+            value = getattr(sprite, field)
+            if isinstance(value, str):
+                digest.update(value.encode())
+            elif isinstance(value, pygame.Vector2):
+                digest.update(struct.pack("<2d", value.x, value.y))
+            else:
+                digest.update(struct.pack("<d", value))
+
+
+def world_digest(game: dict) -> bytes:
+    """SHA-256 over the simulation state that a replay must reproduce"""
+    digest = hashlib.sha256()
+    digest.update(
+        struct.pack(
+            "<qdd",
+            game["score"],
+            game["powerup_spawn_timer"],
+            game["asteroid_field"].spawn_timer,
+        )
+    )
+    _pack_sprites(
+        digest,
+        [game["player"]],
+        "position",
+        "velocity",
+        "rotation",
+        "shoot_timer",
+        "bomb_timer",
+    )
+    _pack_sprites(digest, [game["powerup_manager"]], *vars(game["powerup_manager"]))
+    _pack_sprites(
+        digest, game["asteroids"], "position", "velocity", "radius", "shape_index"
+    )
+    _pack_sprites(digest, game["shots"], "position", "velocity")
+    _pack_sprites(digest, game["bombs"], "position", "lifetime", "exploded")
+    _pack_sprites(digest, game["powerups"], "position", "rotation", "powerup_type")
+
+    # Particles are left out: they are cosmetic and their count depends on
+    # the render quality the machine could sustain
+    digest.update(repr(random.getstate()).encode())
+    return digest.digest()
@@ -0,0 +1,57 @@
+import pygame
+
+from asteroids.constants import RENDER_SCALES
+from asteroids.logger import log_event
+from asteroids.quality import BudgetGovernor
+
+
+class ResolutionScaler(BudgetGovernor):
+    """Off-screen render target for the world at a fraction of the window size.
+
+    The world is drawn to `surface` with coordinates multiplied by `scale`,
+    then stretched over the window in a single scale call before the HUD is
+    drawn at full resolution. At scale 1.0 `surface` is the window itself
+    and presenting is free. When enabled, the scale steps through
+    RENDER_SCALES by frame time like the quality governor.
+    """
+
+    levels: tuple[float, ...] = RENDER_SCALES
+
+    def __init__(self, window: pygame.Surface, scale: float = 1.0) -> None:
+        super().__init__()
+        self.window: pygame.Surface = window
+        self.surface: pygame.Surface = window
+        self.scale: float = 1.0
+        self.set_scale(scale)
+
+    def set_scale(self, scale: float) -> None:
+        """Render at `scale` of the window size, clamped to RENDER_SCALES' range"""
+        scale = min(max(scale, min(RENDER_SCALES)), 1.0)
+        # The nearest step, so the governor continues from there when enabled
+        self.level = min(
+            range(len(RENDER_SCALES)), key=lambda i: abs(RENDER_SCALES[i] - scale)
+        )
+        self._resize(scale)
+
+    def _resize(self, scale: float) -> None:
+        self.scale = scale
+        width, height = self.window.get_size()
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        if size == self.window.get_size():
+            self.surface = self.window
+        elif size != self.surface.get_size():
+            self.surface = pygame.Surface(size).convert(self.window)
+
+    def apply(self, previous: int) -> None:
+        log_event(
+            "render_scale_changed",
+            scale=RENDER_SCALES[self.level],
+            previous=RENDER_SCALES[previous],
+            frame_ms=round(self.average * 1000, 2),
+        )
+        self._resize(RENDER_SCALES[self.level])
+
+    def present(self) -> None:
+        """Stretch the world over the window, unless it was drawn there"""
+        if self.surface is not self.window:
+            pygame.transform.scale(self.surface, self.window.get_size(), self.window)
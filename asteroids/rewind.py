@@ -0,0 +1,292 @@
+import random
+import time
+import zlib
+from collections import deque
+from collections.abc import Callable
+from operator import attrgetter
+
+import numpy as np
+import pygame
+
+from asteroids.asteroid import Asteroid
+from asteroids.bomb import Bomb
+from asteroids.constants import (
+    REWIND_CAPACITY,
+    REWIND_KEYFRAME_INTERVAL,
+    REWIND_MAX_BYTES,
+)
+from asteroids.entities import EntityStore
+from asteroids.powerup import PowerUp, PowerUpManager
+from asteroids.shot import Shot
+
+# Entity classes in a snapshot, with the attributes they keep outside their
+# table columns and how to convert those back from floats
+_ENTITIES: tuple[tuple[type, tuple[tuple[str, Callable], ...]], ...] = (
+    (Asteroid, (("shape_index", int),)),
+    (Shot, ()),
+    (Bomb, ()),
+    (PowerUp, (("rotation", float), ("type_index", int))),
+)
+_COLUMNS: int = 6  # x, y, vx, vy, radius, lifetime
+_PARTICLE_COLUMNS: int = 5  # x, y, vx, vy, lifetime
+
+_MANAGER_FIELDS: tuple[str, ...] = tuple(vars(PowerUpManager()))
+_PLAYER_FIELDS: tuple[str, ...] = ("rotation", "shoot_timer", "bomb_timer")
+# score, two spawn timers and step_dt, the player's position and velocity,
+# then the named fields and the random module's cached gauss value
+_HEADER: int = 4 + 4 + len(_PLAYER_FIELDS) + len(_MANAGER_FIELDS) + 1
+_RANDOM_WORDS: int = len(random.getstate()[1])
+
+
+def snapshot(game: dict) -> np.ndarray:
+    """The simulation state of a game, flattened into one float64 array
+
+    Layout: header scalars, the random module's Mersenne Twister words,
+    row counts per entity class and for particles, then each class's rows
+    and the live particles. Everything but the particles is stored
+    exactly, so a restored game continues the same way the original did.
+    """
+    player = game["player"]
+    manager = game["powerup_manager"]
+    store: EntityStore = game["store"]
+    particles = game["particles"]
+    _, words, gauss = random.getstate()
+
+    header = [
+        game["score"],
+        game["powerup_spawn_timer"],
+        game["asteroid_field"].spawn_timer,
+        game["step_dt"],
+        *player.position,
+        *player.velocity,
+        *(getattr(player, name) for name in _PLAYER_FIELDS),
+        *(getattr(manager, name) for name in _MANAGER_FIELDS),
+        np.nan if gauss is None else gauss,
+    ]
+    live = np.flatnonzero(particles.lifetimes > 0)
+    counts = [len(store.table(cls)) for cls, _ in _ENTITIES] + [len(live)]
+    parts = [np.array(header, np.float64), np.array(words, np.float64), counts]
+
+    for cls, fields in _ENTITIES:
+        table = store.table(cls)
+        count = len(table)
+        rows = np.empty((count, _COLUMNS + len(fields)))
+        rows[:, 0:2] = table.positions[:count]
+        rows[:, 2:4] = table.velocities[:count]
+        rows[:, 4] = table.radii[:count]
+        rows[:, 5] = table.lifetimes[:count]
+        for i, (name, _) in enumerate(fields, _COLUMNS):
+            rows[:, i] = np.fromiter(
+                map(attrgetter(name), table.entities), np.float64, count
+            )
+        parts.append(rows.ravel())
+
+    # Particles don't feed back into the simulation, so they are kept at
+    # float32 precision, two values per float64 slot
+    rows = np.zeros(_particle_words(len(live)) * 2, np.float32)
+    view = rows[: len(live) * _PARTICLE_COLUMNS].reshape(-1, _PARTICLE_COLUMNS)
+    view[:, 0:2] = particles.positions[live]
+    view[:, 2:4] = particles.velocities[live]
+    view[:, 4] = particles.lifetimes[live]
+    parts.append(rows.view(np.float64))
+    return np.concatenate(parts)
+
+
+def _particle_words(count: int) -> int:
+    return (count * _PARTICLE_COLUMNS + 1) // 2
+
+
+def _restore_table(
+    store: EntityStore,
+    cls: type,
+    fields: tuple[tuple[str, Callable], ...],
+    rows: np.ndarray,
+) -> None:
+    # Reuse the live entities in place, kill the surplus and spawn the rest
+    table = store.table(cls)
+    count = len(rows)
+    for entity in table.entities[count:][::-1]:
+        entity.kill()
+    for x, y, radius in rows[len(table) :, [0, 1, 4]].tolist():
+        if cls is Asteroid:
+            store.spawn(cls, x, y, radius)
+        else:
+            store.spawn(cls, x, y)
+
+    table.positions[:count] = rows[:, 0:2]
+    table.previous[:count] = rows[:, 0:2]
+    table.velocities[:count] = rows[:, 2:4]
+    table.radii[:count] = rows[:, 4]
+    table.lifetimes[:count] = rows[:, 5]
+    for i, (name, convert) in enumerate(fields, _COLUMNS):
+        for entity, value in zip(table.entities, rows[:, i].tolist()):
+            setattr(entity, name, convert(value))
+
+
+def restore(game: dict, state: np.ndarray) -> None:
+    """Put a game back into the state a snapshot() was taken in"""
+    player = game["player"]
+    manager = game["powerup_manager"]
+    store: EntityStore = game["store"]
+    particles = game["particles"]
+
+    header = state[:_HEADER].tolist()
+    game["score"] = int(header[0])
+    game["powerup_spawn_timer"] = header[1]
+    game["asteroid_field"].spawn_timer = header[2]
+    game["step_dt"] = header[3]
+    player.position = pygame.Vector2(header[4], header[5])
+    player.velocity = pygame.Vector2(header[6], header[7])
+    offset = 8
+    for name in _PLAYER_FIELDS:
+        setattr(player, name, header[offset])
+        offset += 1
+    for name in _MANAGER_FIELDS:
+        value = header[offset]
+        setattr(manager, name, bool(value) if name.endswith("_active") else value)
+        offset += 1
+    player.shield_active = manager.shield_active
+    player.speed_boost_active = manager.speed_boost_active
+    player.rapid_fire_active = manager.rapid_fire_active
+    player.triple_shot_active = manager.triple_shot_active
+    gauss = None if np.isnan(header[-1]) else header[-1]
+    words = tuple(int(word) for word in state[_HEADER : _HEADER + _RANDOM_WORDS])
+
+    offset = _HEADER + _RANDOM_WORDS
+    counts = state[offset : offset + len(_ENTITIES) + 1].astype(int).tolist()
+    offset += len(counts)
+    for (cls, fields), count in zip(_ENTITIES, counts):
+        width = _COLUMNS + len(fields)
+        rows = state[offset : offset + count * width].reshape(count, width)
+        _restore_table(store, cls, fields, rows)
+        offset += count * width
+    player.table.previous[player.slot] = player.table.positions[player.slot]
+
+    count = counts[-1]
+    rows = state[offset : offset + _particle_words(count)].view(np.float32)
+    rows = rows[: count * _PARTICLE_COLUMNS].reshape(count, _PARTICLE_COLUMNS)
+    particles.lifetimes[:] = 0.0
+    particles.positions[:count] = rows[:, 0:2]
+    particles.velocities[:count] = rows[:, 2:4]
+    particles.lifetimes[:count] = rows[:, 4]
+    particles.head = count % particles.capacity
+    particles.live = count
+
+    # Last, as spawning entities above drew from the random module
+    random.setstate((3, words, gauss))
+
+
+def _fit(words: np.ndarray, length: int) -> np.ndarray:
+    if len(words) >= length:
+        return words[:length]
+    return np.concatenate([words, np.zeros(length - len(words), words.dtype)])
+
+
+class RewindBuffer:
+    """Recent world snapshots, compressed, for playing time backwards.
+
+    Every `keyframe_interval`-th snapshot is a keyframe, stored whole; the
+    ones in between store their XOR against the latest keyframe. Most of
+    the world barely changes between the two, so the XOR is mostly zero
+    bits and compresses to a fraction of the keyframe. The oldest
+    snapshots are dropped beyond `capacity` or `max_bytes`; a keyframe
+    counts towards `bytes` until the last snapshot built on it is gone.
+    """
+
+    def __init__(
+        self,
+        capacity: int = REWIND_CAPACITY,
+        keyframe_interval: int = REWIND_KEYFRAME_INTERVAL,
+        max_bytes: int = REWIND_MAX_BYTES,
+    ) -> None:
+        self.capacity: int = capacity
+        self.keyframe_interval: int = keyframe_interval
+        self.max_bytes: int = max_bytes
+        # (compressed keyframe, compressed XOR or None for the keyframe)
+        self.entries: deque[tuple[bytes, bytes | None]] = deque()
+        self.bytes: int = 0
+        # Entries sharing each buffered keyframe, by id() of its blob
+        self.key_refs: dict[int, int] = {}
+        self.key: np.ndarray | None = None  # Latest keyframe, as raw words
+        self.key_blob: bytes = b""
+        self.since_key: int = 0
+        self.snapshot_times: deque[float] = deque(maxlen=capacity)
+        self.restore_time: float = 0.0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def record(self, game: dict) -> None:
+        """Snapshot the game after a simulation step"""
+        start = time.perf_counter()
+        words = snapshot(game).view(np.uint64)
+        if (
+            self.key is None
+            or self.since_key >= self.keyframe_interval
+            # Evicted along with every snapshot built on it
+            or id(self.key_blob) not in self.key_refs
+        ):
+            self.key = words
+            self.key_blob = zlib.compress(words.tobytes(), 1)
+            self.since_key = 0
+            self.key_refs[id(self.key_blob)] = 0
+            self.bytes += len(self.key_blob)
+            entry = (self.key_blob, None)
+        else:
+            delta = zlib.compress((words ^ _fit(self.key, len(words))).tobytes(), 1)
+            self.bytes += len(delta)
+            entry = (self.key_blob, delta)
+        self.key_refs[id(self.key_blob)] += 1
+        self.since_key += 1
+        self.entries.append(entry)
+        while len(self.entries) > self.capacity or self.bytes > self.max_bytes:
+            self._drop(self.entries.popleft())
+        self.snapshot_times.append(time.perf_counter() - start)
+
+    def _drop(self, entry: tuple[bytes, bytes | None]) -> None:
+        key_blob, delta = entry
+        if delta is not None:
+            self.bytes -= len(delta)
+        self.key_refs[id(key_blob)] -= 1
+        if self.key_refs[id(key_blob)] == 0:
+            # Nothing left needs this keyframe, so its memory is freed
+            del self.key_refs[id(key_blob)]
+            self.bytes -= len(key_blob)
+
+    def _decode(self, entry: tuple[bytes, bytes | None]) -> np.ndarray:
+        key_blob, delta = entry
+        key = np.frombuffer(zlib.decompress(key_blob), np.uint64)
+        if delta is None:
+            return key.view(np.float64)
+        words = np.frombuffer(zlib.decompress(delta), np.uint64)
+        return (words ^ _fit(key, len(words))).view(np.float64)
+
+    def step_back(self, game: dict, steps: int) -> bool:
+        """Restore the game `steps` snapshots back, as far as the buffer goes
+
+        The newest snapshot is the current state, so the oldest one is
+        never dropped. Returns False when there was nothing to go back to.
+        """
+        if steps <= 0 or len(self.entries) < 2:
+            return False
+        start = time.perf_counter()
+        for _ in range(min(steps, len(self.entries) - 1)):
+            self._drop(self.entries.pop())
+        restore(game, self._decode(self.entries[-1]))
+        # The next snapshot starts a new keyframe, the current one may just
+        # have been dropped from the buffer
+        self.key = None
+        self.restore_time = time.perf_counter() - start
+        return True
+
+    def stats(self) -> dict[str, float]:
+        """Buffered snapshots, their memory and timings in milliseconds"""
+        times = self.snapshot_times
+        mean = sum(times) / len(times) if times else 0.0
+        return {
+            "snapshots": len(self.entries),
+            "bytes": self.bytes,
+            "snapshot_mean_ms": round(mean * 1000, 4),
+            "snapshot_max_ms": round(max(times, default=0.0) * 1000, 4),
+            "restore_ms": round(self.restore_time * 1000, 4),
+        }
@@ -0,0 +1,122 @@
+import math
+import random
+from collections import OrderedDict
+
+import pygame
+
+from asteroids.constants import (
+    ASTEROID_SHAPE_CACHE_SIZE,
+    ASTEROID_SHAPE_TEMPLATES,
+    LINE_WIDTH,
+)
+
+
+def line_width(scale: float) -> int:
+    """LINE_WIDTH for a render target at `scale`, so outlines scale up evenly"""
+    return max(1, round(LINE_WIDTH * scale))
+
+
+class ShapeLibrary:
+    """Precomputed lumpy asteroid outlines with pre-rendered surfaces.
+
+    Each radius gets `templates_per_radius` outlines generated from a fixed
+    seed, so shapes never touch the game's global RNG. Rendered outlines
+    are cached for one render scale at a time, with least-recently-used
+    eviction once `max_surfaces` is exceeded.
+    """
+
+    def __init__(
+        self,
+        templates_per_radius: int = ASTEROID_SHAPE_TEMPLATES,
+        max_surfaces: int = ASTEROID_SHAPE_CACHE_SIZE,
+        seed: int = 0,
+    ) -> None:
+        self.templates_per_radius: int = templates_per_radius
+        self.max_surfaces: int = max_surfaces
+        self.seed: int = seed
+        self.templates: dict[float, list[list[tuple[float, float]]]] = {}
+        self.surfaces: OrderedDict[tuple[float, int, bool], pygame.Surface]
+        self.surfaces = OrderedDict()
+        self.scale: float = 1.0  # Render scale of the cached surfaces
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def configure(
+        self, templates_per_radius: int | None = None, max_surfaces: int | None = None
+    ) -> None:
+        """Change the library size, dropping anything that no longer fits"""
+        if templates_per_radius is not None:
+            self.templates_per_radius = templates_per_radius
+            self.templates.clear()
+            self.surfaces.clear()
+        if max_surfaces is not None:
+            self.max_surfaces = max_surfaces
+            while len(self.surfaces) > self.max_surfaces:
+                self.surfaces.popitem(last=False)
+
+    def pick(self) -> int:
+        """Choose a template index for a new asteroid"""
+        return random.randrange(self.templates_per_radius)
+
+    def _generate(self, radius: float) -> list[list[tuple[float, float]]]:
+        rng = random.Random(f"{self.seed}:{radius}")
+        templates = []
+        for _ in range(self.templates_per_radius):
+            num_points = rng.randint(8, 12)
+            points = []
+            for i in range(num_points):
+                angle = math.radians((360 / num_points) * i)
+                # Vary radius by up to 20%
+                point_radius = radius * rng.uniform(0.8, 1.2)
+                points.append(
+                    (point_radius * math.cos(angle), point_radius * math.sin(angle))
+                )
+            templates.append(points)
+        return templates
+
+    def points(self, radius: float, index: int) -> list[tuple[float, float]]:
+        """Outline vertices of a template, relative to the asteroid center"""
+        templates = self.templates.get(radius)
+        if templates is None:
+            templates = self.templates[radius] = self._generate(radius)
+        return templates[index % len(templates)]
+
+    def surface(
+        self, radius: float, index: int, simple: bool = False, scale: float = 1.0
+    ) -> pygame.Surface:
+        """Pre-rendered outline of a template, centered in the surface
+
+        A `simple` outline keeps every other vertex, which is cheaper to blit.
+        `scale` shrinks the same outline for reduced-resolution rendering.
+        """
+        if scale != self.scale:
+            # Outlines at the old scale won't be drawn again until it comes
+            # back, so don't let them crowd out the new working set
+            self.surfaces.clear()
+            self.scale = scale
+        key = (radius, index, simple)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        width = line_width(scale)
+        half = math.ceil(radius * scale * 1.2) + width
+        surface = pygame.Surface((half * 2, half * 2))
+        surface.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        points = [
+            (half + x * scale, half + y * scale) for x, y in self.points(radius, index)
+        ]
+        if simple:
+            points = points[::2]
+        pygame.draw.polygon(surface, "white", points, width)
+
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+        return surface
+
+
+asteroid_shapes = ShapeLibrary()
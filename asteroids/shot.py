@@ -1,28 +1,33 @@
 import pygame
 
 from asteroids.circleshape import CircleShape
-from asteroids.constants import (
-    LINE_WIDTH,
-    SCREEN_HEIGHT,
-    SCREEN_WIDTH,
-    SHOT_RADIUS,
-)
+from asteroids.constants import SHOT_RADIUS
+from asteroids.entities import CULL, ComponentTable, EntityStore
+from asteroids.shapes import line_width
 
 
 class Shot(CircleShape):
-    def __init__(self, x: float, y: float) -> None:
-        super().__init__(x, y, SHOT_RADIUS)
+    boundary = CULL
 
-    def draw(self, screen: pygame.Surface) -> None:
-        pygame.draw.circle(screen, "white", self.position, self.radius, LINE_WIDTH)
+    def __init__(self, store: EntityStore, x: float, y: float) -> None:
+        super().__init__(store, x, y, SHOT_RADIUS)
 
-    def update(self, dt: float) -> None:
-        self.position += self.velocity * dt
-        # Remove shots that go off screen
-        if (
-            self.position.x < -self.radius
-            or self.position.x > SCREEN_WIDTH + self.radius
-            or self.position.y < -self.radius
-            or self.position.y > SCREEN_HEIGHT + self.radius
+    def draw(self, screen: pygame.Surface, scale: float = 1.0) -> None:
+        pygame.draw.circle(
+            screen,
+            "white",
+            self.position * scale,
+            self.radius * scale,
+            line_width(scale),
+        )
+
+    @classmethod
+    def draw_all(
+        cls, screen: pygame.Surface, table: ComponentTable, scale: float = 1.0
+    ) -> None:
+        count = len(table)
+        for position, radius in zip(
+            (table.positions[:count] * scale).tolist(),
+            (table.radii[:count] * scale).tolist(),
         ):
-            self.kill()
+            pygame.draw.circle(screen, "white", position, radius, line_width(scale))
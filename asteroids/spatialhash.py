@@ -0,0 +1,94 @@
+import math
+from typing import Any
+
+import numpy as np
+import pygame
+
+from asteroids.constants import SCREEN_HEIGHT, SCREEN_WIDTH, SPATIAL_HASH_CELL_SIZE
+
+
+class SpatialHash:
+    """Uniform grid over the screen used as a collision broadphase.
+
+    Each sprite is stored in the cell containing its center and queries are
+    widened by the largest stored radius. Cell coordinates wrap around the
+    screen edges, so objects that have drifted past an edge hash into the
+    cells on the opposite side.
+    """
+
+    def __init__(self, cell_size: float = SPATIAL_HASH_CELL_SIZE) -> None:
+        self.cell_size: float = cell_size
+        self.cols: int = max(1, math.ceil(SCREEN_WIDTH / cell_size))
+        self.rows: int = max(1, math.ceil(SCREEN_HEIGHT / cell_size))
+        self.cells: list[list[int]] = [[] for _ in range(self.cols * self.rows)]
+        self.occupied: list[int] = []
+        self.sprites: list[Any] = []
+        self.max_radius: float = 0.0
+        self.max_speed: float = 0.0
+
+    def clear(self) -> None:
+        for index in self.occupied:
+            self.cells[index].clear()
+        self.occupied.clear()
+        self.sprites.clear()
+        self.max_radius = 0.0
+        self.max_speed = 0.0
+
+    def rebuild_from_arrays(
+        self,
+        sprites: list[Any],
+        positions: np.ndarray,
+        radii: np.ndarray,
+        velocities: np.ndarray,
+    ) -> None:
+        """Bulk-load sprites whose positions and radii live in NumPy arrays"""
+        self.clear()
+        count = len(sprites)
+        if count == 0:
+            return
+        columns = np.floor(positions[:count, 0] / self.cell_size).astype(int)
+        rows = np.floor(positions[:count, 1] / self.cell_size).astype(int)
+        indices = (rows % self.rows) * self.cols + columns % self.cols
+        self.sprites.extend(sprites)
+        for order, index in enumerate(indices.tolist()):
+            cell = self.cells[index]
+            if not cell:
+                self.occupied.append(index)
+            cell.append(order)
+        self.max_radius = float(radii[:count].max())
+        self.max_speed = float(np.sqrt((velocities[:count] ** 2).sum(axis=1).max()))
+
+    def query_indices(self, position: pygame.Vector2, radius: float) -> list[int]:
+        """Return indices into `sprites` of everything that may overlap the circle"""
+        return self.query_indices_at(position.x, position.y, radius)
+
+    def query_indices_at(self, x: float, y: float, radius: float) -> list[int]:
+        """query_indices() for a center given as plain coordinates"""
+        if not self.sprites:
+            return []
+        cols, rows, size = self.cols, self.rows, self.cell_size
+        reach = radius + self.max_radius
+        x0 = math.floor((x - reach) / size)
+        x1 = math.floor((x + reach) / size)
+        y0 = math.floor((y - reach) / size)
+        y1 = math.floor((y + reach) / size)
+        if x1 - x0 >= cols:
+            xs = range(cols)
+        else:
+            xs = [cx % cols for cx in range(x0, x1 + 1)]
+        if y1 - y0 >= rows:
+            ys = range(rows)
+        else:
+            ys = [cy % rows for cy in range(y0, y1 + 1)]
+
+        found: list[int] = []
+        for cy in ys:
+            row = cy * cols
+            for cx in xs:
+                found.extend(self.cells[row + cx])
+        found.sort()
+        return found
+
+    def query(self, position: pygame.Vector2, radius: float) -> list[Any]:
+        """Return sprites that may overlap the circle, in insertion order"""
+        return [self.sprites[i] for i in self.query_indices(position, radius)]
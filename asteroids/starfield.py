@@ -0,0 +1,97 @@
+import random
+
+import pygame
+
+from asteroids.constants import (
+    PARALLAX_STARS_PER_LAYER,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    STAR_COUNT,
+    STARFIELD_PARALLAX_LAYERS,
+)
+
+BACKGROUND_COLOR: tuple[int, int, int] = (10, 10, 20)  # Dark blue-black
+
+
+class Starfield:
+    """Starfield background rendered once to off-screen surfaces.
+
+    The static layer is blitted in a single call. Optional parallax layers
+    are pre-rendered, screen-sized transparent tiles that are scrolled by
+    an offset instead of being redrawn, so star counts are free per frame.
+    """
+
+    def __init__(
+        self,
+        star_count: int = STAR_COUNT,
+        parallax_layers: int = STARFIELD_PARALLAX_LAYERS,
+        stars_per_layer: int = PARALLAX_STARS_PER_LAYER,
+        seed: int | None = None,
+    ) -> None:
+        # Own RNG so the background never disturbs the game's random state
+        self.rng: random.Random = random.Random(seed)
+        self.base: pygame.Surface = self._render(star_count, BACKGROUND_COLOR, 100)
+
+        # Deeper layers are dimmer and scroll slower
+        self.layers: list[tuple[pygame.Surface, float]] = []
+        for depth in range(1, parallax_layers + 1):
+            tile = self._render(stars_per_layer, (0, 0, 0), 60 + 140 // depth)
+            tile.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+            self.layers.append((tile, 0.5 / depth))
+        # Copies of base and layers for smaller render targets, by size
+        self.scaled: dict[
+            tuple[int, int],
+            tuple[pygame.Surface, list[tuple[pygame.Surface, float]]],
+        ] = {}
+
+    def _render(
+        self, count: int, fill: tuple[int, int, int], min_brightness: int
+    ) -> pygame.Surface:
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(fill)
+        for _ in range(count):
+            x = self.rng.randint(0, SCREEN_WIDTH)
+            y = self.rng.randint(0, SCREEN_HEIGHT)
+            brightness = self.rng.randint(min_brightness, 255)
+            pygame.draw.circle(surface, (brightness, brightness, brightness), (x, y), 1)
+        return surface
+
+    def _for_size(
+        self, size: tuple[int, int]
+    ) -> tuple[pygame.Surface, list[tuple[pygame.Surface, float]]]:
+        if size == (SCREEN_WIDTH, SCREEN_HEIGHT):
+            return self.base, self.layers
+        scaled = self.scaled.get(size)
+        if scaled is None:
+            # Nearest-neighbour scaling keeps the layers' colorkey exact
+            layers = []
+            for tile, speed in self.layers:
+                small = pygame.transform.scale(tile, size)
+                small.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+                layers.append((small, speed))
+            scaled = self.scaled[size] = (
+                pygame.transform.scale(self.base, size),
+                layers,
+            )
+        return scaled
+
+    def draw(
+        self, screen: pygame.Surface, offset: pygame.Vector2 | None = None
+    ) -> None:
+        """Fill `screen` with the starfield, scaled down to its size if smaller"""
+        width, height = screen.get_size()
+        base, layers = self._for_size((width, height))
+        screen.blit(base, (0, 0))
+        if offset is None:
+            return
+        scale = width / SCREEN_WIDTH
+        for tile, speed in layers:
+            # Tile the layer so any scroll offset covers the whole screen
+            x = int(-offset.x * speed * scale) % width
+            y = int(-offset.y * speed * scale) % height
+            screen.blit(tile, (x - width, y - height))
+            screen.blit(tile, (x, y - height))
+            screen.blit(tile, (x - width, y))
+            screen.blit(tile, (x, y))
@@ -0,0 +1,36 @@
+import time
+
+# Set when this module is first imported, which both entry points do before
+# loading pygame, numpy and the rest of the game
+_IMPORTED: float = time.perf_counter()
+
+
+class StartupTimer:
+    """Wall-clock latency of startup phases, from import to first frame.
+
+    Each lap() closes the phase named and starts the next one; the first
+    phase starts when this module was imported. restart() starts timing a
+    fresh sequence, e.g. from the restart key to the new game's first frame.
+    """
+
+    def __init__(self, start: float = _IMPORTED) -> None:
+        self.last: float = start
+        self.phases: dict[str, float] = {}
+
+    def restart(self) -> None:
+        self.last = time.perf_counter()
+        self.phases = {}
+
+    def lap(self, phase: str) -> None:
+        now = time.perf_counter()
+        self.phases[phase] = now - self.last
+        self.last = now
+
+    def report(self) -> dict[str, float]:
+        """Phase durations plus their total, in milliseconds"""
+        report = {phase: round(t * 1000, 2) for phase, t in self.phases.items()}
+        report["total"] = round(sum(self.phases.values()) * 1000, 2)
+        return report
+
+
+startup: StartupTimer = StartupTimer()
@@ -0,0 +1,287 @@
+"""Batch simulator for sweeping gameplay constants across many headless games.
+
+Example:
+    python -m asteroids.sweep --param BOMB_RADIUS=60,100,140 \\
+        --param ASTEROID_SPAWN_RATE_SECONDS=0.5,0.8 --games 200 --out sweep.csv
+"""
+
+import argparse
+import ast
+import csv
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
+from typing import Any, TextIO
+
+# Workers never open a window, keep their startup quiet and cheap
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from asteroids import constants
+from asteroids.controls import BOMB, SHOOT, THRUST, TURN_LEFT, TURN_RIGHT
+from asteroids.logger import configure_event_log
+from asteroids.main import check_collisions, init_game, update_game
+from asteroids.replay import Recording
+
+Policy = Callable[[int], int]
+
+
+def _random_policy(rng: random.Random) -> Policy:
+    # Hold each key combination for a short while, like a human would
+    state = {"controls": 0, "hold": 0}
+
+    def policy(frame: int) -> int:
+        if state["hold"] <= 0:
+            state["hold"] = rng.randint(5, 30)
+            state["controls"] = (
+                (THRUST if rng.random() < 0.5 else 0)
+                | (TURN_LEFT if rng.random() < 0.3 else 0)
+                | (TURN_RIGHT if rng.random() < 0.3 else 0)
+                | (SHOOT if rng.random() < 0.8 else 0)
+                | (BOMB if rng.random() < 0.05 else 0)
+            )
+        state["hold"] -= 1
+        return state["controls"]
+
+    return policy
+
+
+def _turret_policy(rng: random.Random) -> Policy:
+    # Stay in place, spin and fire
+    return lambda frame: TURN_LEFT | SHOOT
+
+
+def _idle_policy(rng: random.Random) -> Policy:
+    return lambda frame: 0
+
+
+POLICIES: dict[str, Callable[[random.Random], Policy]] = {
+    "random": _random_policy,
+    "turret": _turret_policy,
+    "idle": _idle_policy,
+}
+
+
+class ScriptPolicy:
+    """Loop the control masks of a recording, ignoring its seed and frame times"""
+
+    def __init__(self, path: str) -> None:
+        self.masks: list[int] = [controls for controls, _ in Recording(path)] or [0]
+
+    def __call__(self, rng: random.Random) -> Policy:
+        return lambda frame: self.masks[frame % len(self.masks)]
+
+
+@contextmanager
+def override_constants(overrides: dict[str, Any]) -> Iterator[None]:
+    """Temporarily replace values from constants.py in every game module
+
+    Modules bind constants with `from asteroids.constants import ...`, so the
+    names are patched wherever they are bound. Values captured at import
+    time, such as default arguments, keep their original value.
+    """
+    modules = [
+        module
+        for name, module in sys.modules.items()
+        if name.startswith("asteroids.") and module is not None
+    ]
+    patched: list[tuple[Any, str, Any]] = []
+    try:
+        for name, value in overrides.items():
+            original = getattr(constants, name)
+            for module in modules:
+                if getattr(module, name, None) is original:
+                    patched.append((module, name, original))
+                    setattr(module, name, value)
+        yield
+    finally:
+        for module, name, original in reversed(patched):
+            setattr(module, name, original)
+
+
+def parse_param(spec: str) -> tuple[str, list[Any]]:
+    """Parse `NAME=v1,v2,...` into a constant name and its values"""
+    name, sep, values = spec.partition("=")
+    name = name.strip()
+    if not sep or not values:
+        raise ValueError(f"Expected NAME=v1,v2,... but got {spec!r}")
+    if not name.isupper() or not hasattr(constants, name):
+        raise ValueError(f"Unknown constant: {name}")
+    return name, [ast.literal_eval(value.strip()) for value in values.split(",")]
+
+
+def expand_grid(grid: dict[str, list[Any]]) -> list[dict[str, Any]]:
+    """Every combination of the grid's values, one override dict each"""
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+
+def simulate(
+    overrides: dict[str, Any],
+    seed: int,
+    policy: Callable[[random.Random], Policy],
+    max_frames: int,
+    dt: float = 1 / 60,
+) -> dict[str, Any]:
+    """Play one headless game until the player dies or max_frames pass"""
+    controls = policy(random.Random(seed))
+    with override_constants(overrides):
+        game = init_game(seed=seed)
+        peak_asteroids = peak_shots = peak_particles = 0
+        game_over = False
+        frame = 0
+        start = time.perf_counter()
+        while frame < max_frames and not game_over:
+            update_game(game, dt, controls(frame))
+            game_over = check_collisions(game)
+            frame += 1
+            peak_asteroids = max(peak_asteroids, len(game["asteroids"]))
+            peak_shots = max(peak_shots, len(game["shots"]))
+            peak_particles = max(peak_particles, len(game["particles"]))
+        elapsed = time.perf_counter() - start
+
+    return {
+        **overrides,
+        "seed": seed,
+        "survival_seconds": round(frame * dt, 3),
+        "game_over": game_over,
+        "score": game["score"],
+        "peak_asteroids": peak_asteroids,
+        "peak_shots": peak_shots,
+        "peak_particles": peak_particles,
+        "wall_seconds": round(elapsed, 3),
+    }
+
+
+def _init_worker() -> None:
+    # Workers would all write to the same event log
+    configure_event_log(path=None)
+
+
+class _ResultWriter:
+    """Streams result rows to a CSV or JSONL file as they arrive"""
+
+    def __init__(self, f: TextIO, fmt: str, fields: list[str]) -> None:
+        self.f: TextIO = f
+        self.csv: csv.DictWriter | None = None
+        if fmt == "csv":
+            self.csv = csv.DictWriter(f, fieldnames=fields)
+            self.csv.writeheader()
+
+    def write(self, row: dict[str, Any]) -> None:
+        if self.csv is not None:
+            self.csv.writerow(row)
+        else:
+            self.f.write(json.dumps(row) + "\n")
+        self.f.flush()
+
+
+def run_sweep(
+    grid: dict[str, list[Any]],
+    out: TextIO,
+    fmt: str = "csv",
+    games: int = 10,
+    seed: int = 0,
+    policy: Callable[[random.Random], Policy] = _random_policy,
+    max_frames: int = 60 * 60 * 5,
+    workers: int | None = None,
+) -> int:
+    """Run `games` seeded games per grid point across a process pool
+
+    Every grid point plays the same seeds, so differences between points
+    come from the overrides rather than from luck. Rows are written in
+    completion order. Returns the number of games played.
+    """
+    fields = [
+        *grid,
+        "seed",
+        "survival_seconds",
+        "game_over",
+        "score",
+        "peak_asteroids",
+        "peak_shots",
+        "peak_particles",
+        "wall_seconds",
+    ]
+    writer = _ResultWriter(out, fmt, fields)
+    jobs = [
+        (overrides, seed + game)
+        for overrides in expand_grid(grid)
+        for game in range(games)
+    ]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        futures = [
+            executor.submit(simulate, overrides, game_seed, policy, max_frames)
+            for overrides, game_seed in jobs
+        ]
+        for future in as_completed(futures):
+            writer.write(future.result())
+    return len(jobs)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--param",
+        action="append",
+        default=[],
+        metavar="NAME=V1,V2",
+        help="constant from constants.py and the values to sweep; repeatable",
+    )
+    parser.add_argument("--games", type=int, default=10, help="games per grid point")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=300.0,
+        help="simulated time limit per game",
+    )
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random")
+    parser.add_argument(
+        "--script",
+        metavar="FILE",
+        help="loop the input of a recording instead of using --policy",
+    )
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument(
+        "--out",
+        default="-",
+        help="results file, .jsonl for JSON lines, otherwise CSV; - for stdout",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        grid = dict(parse_param(spec) for spec in args.param)
+    except (ValueError, SyntaxError) as e:
+        parser.error(str(e))
+    policy = ScriptPolicy(args.script) if args.script else POLICIES[args.policy]
+    fmt = "jsonl" if args.out.endswith(".jsonl") else "csv"
+
+    start = time.perf_counter()
+    with (
+        nullcontext(sys.stdout) if args.out == "-" else open(args.out, "w", newline="")
+    ) as out:
+        played = run_sweep(
+            grid,
+            out,
+            fmt,
+            games=args.games,
+            seed=args.seed,
+            policy=policy,
+            max_frames=round(args.max_seconds * 60),
+            workers=args.workers,
+        )
+    elapsed = time.perf_counter() - start
+    print(f"{played} games in {elapsed:.1f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
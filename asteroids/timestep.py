@@ -0,0 +1,36 @@
+from asteroids.constants import MAX_SIM_STEPS_PER_FRAME, SIM_TICK_RATE
+
+
+class FixedTimestep:
+    """Turns variable frame times into a whole number of fixed sim steps.
+
+    Frame time is accumulated and consumed in steps of 1 / tick_rate. At
+    most `max_steps` run per frame; time beyond that is dropped, so a slow
+    frame slows the game down instead of snowballing into ever more steps.
+    """
+
+    def __init__(
+        self,
+        tick_rate: float = SIM_TICK_RATE,
+        max_steps: int = MAX_SIM_STEPS_PER_FRAME,
+    ) -> None:
+        self.step: float = 1 / tick_rate
+        self.max_steps: int = max_steps
+        self.accumulator: float = 0.0
+        self.dropped_steps: int = 0
+
+    def advance(self, frame_dt: float) -> int:
+        """Add a frame's time and return how many steps to simulate"""
+        self.accumulator += frame_dt
+        steps = int(self.accumulator / self.step)
+        if steps > self.max_steps:
+            self.dropped_steps += steps - self.max_steps
+            steps = self.max_steps
+            self.accumulator = steps * self.step
+        self.accumulator -= steps * self.step
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        """How far the display is between the last two sim states, 0 to 1"""
+        return min(self.accumulator / self.step, 1.0)
@@ -0,0 +1,91 @@
+import os
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pytest
+
+from asteroids.controls import BOMB, SHOOT, THRUST, TURN_LEFT, TURN_RIGHT
+from asteroids.headless import spawn_asteroids
+from asteroids.logger import configure_event_log
+from asteroids.main import check_collisions, init_game, update_game
+from asteroids.replay import world_digest
+from asteroids.rewind import RewindBuffer
+
+configure_event_log(path=None)
+
+
+def _retained(buffer: RewindBuffer) -> int:
+    # Bytes actually held: each shared keyframe once, plus every delta
+    keys = {id(key): len(key) for key, _ in buffer.entries}
+    deltas = sum(len(delta) for _, delta in buffer.entries if delta is not None)
+    return sum(keys.values()) + deltas
+
+
+def _play(buffer: RewindBuffer, steps: int, asteroids: int = 200) -> dict:
+    game = init_game(seed=1)
+    spawn_asteroids(game["store"], asteroids)
+    for _ in range(steps):
+        update_game(game, 1 / 60)
+        check_collisions(game)
+        buffer.record(game)
+    return game
+
+
+def test_bytes_match_retained_size_past_max_bytes():
+    buffer = RewindBuffer(capacity=600, keyframe_interval=30, max_bytes=100_000)
+    _play(buffer, 300)
+    assert len(buffer) < 300  # Evicted by size, not capacity
+    assert buffer.bytes == _retained(buffer)
+    assert buffer.bytes <= buffer.max_bytes
+
+
+def test_bytes_match_retained_size_after_step_back():
+    buffer = RewindBuffer(capacity=120, keyframe_interval=30)
+    game = _play(buffer, 200)
+    assert buffer.step_back(game, 45)
+    for _ in range(20):
+        update_game(game, 1 / 60)
+        buffer.record(game)
+    assert buffer.bytes == _retained(buffer)
+
+
+def test_keyframe_larger_than_max_bytes():
+    buffer = RewindBuffer(max_bytes=1)
+    _play(buffer, 5)
+    assert len(buffer) == 0
+    assert buffer.bytes == 0
+
+
+def _inputs(steps: int) -> list[int]:
+    rng = random.Random(5)
+    bits = (THRUST, TURN_LEFT, TURN_RIGHT, SHOOT, BOMB)
+    return [sum(bit for bit in bits if rng.random() < 0.4) for _ in range(steps)]
+
+
+def _step(game: dict, controls: int) -> bytes:
+    update_game(game, 1 / 60, controls)
+    check_collisions(game)
+    return world_digest(game)
+
+
+# A keyframe, deltas on the first and a later keyframe, and the oldest entry
+@pytest.mark.parametrize("k", [30, 40, 75, 0])
+def test_step_back_restores_the_world(k):
+    inputs = _inputs(90)
+    buffer = RewindBuffer(keyframe_interval=30)
+    game = init_game(seed=3)
+    spawn_asteroids(game["store"], 40)
+    buffer.record(game)
+    digests = [world_digest(game)]
+    for controls in inputs:
+        digests.append(_step(game, controls))
+        buffer.record(game)
+
+    assert buffer.step_back(game, len(inputs) - k)
+    assert world_digest(game) == digests[k]
+
+    # Playing the same input forward again retraces the original run
+    for step, controls in enumerate(inputs[k:], k + 1):
+        assert _step(game, controls) == digests[step]